@@ -1,13 +1,17 @@
 """
 pypptx-engine: JSON to PowerPoint presentation generator
 """
-from .engine import PPTXEngine
-from .slides import SlideManager
-from .shapes import ShapeFactory
-from .formatters import FontFormatter, LineFormatter, ShadowFormatter, ColorFormatter
-from .flowchart import FlowchartHandler, FlowchartLayoutManager
-from .templates import TemplateManager
-from .animations import AnimationManager, TransitionPresets, AnimationPresets
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .engine import PPTXEngine
+    from .slides import SlideManager
+    from .shapes import ShapeFactory
+    from .formatters import FontFormatter, LineFormatter, ShadowFormatter, ColorFormatter
+    from .flowchart import FlowchartHandler, FlowchartLayoutManager
+    from .templates import TemplateManager
+    from .animations import AnimationManager, TransitionPresets, AnimationPresets
 
 __version__ = "0.1.0"
 __all__ = [
@@ -24,4 +28,35 @@ __all__ = [
     'AnimationManager',
     'TransitionPresets',
     'AnimationPresets'
-]
\ No newline at end of file
+]
+
+# Public name -> submodule. Submodules pull in python-pptx, so they are only imported on first
+# access; this keeps e.g. `pypptx-engine --help` from paying for them.
+_EXPORTS = {
+    'PPTXEngine': '.engine',
+    'SlideManager': '.slides',
+    'ShapeFactory': '.shapes',
+    'FontFormatter': '.formatters',
+    'LineFormatter': '.formatters',
+    'ShadowFormatter': '.formatters',
+    'ColorFormatter': '.formatters',
+    'FlowchartHandler': '.flowchart',
+    'FlowchartLayoutManager': '.flowchart',
+    'TemplateManager': '.templates',
+    'AnimationManager': '.animations',
+    'TransitionPresets': '.animations',
+    'AnimationPresets': '.animations'
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,649 +3,691 @@ Animation and transition system for PPTX Engine.
 Provides slide transitions and shape animations.
 """
 
-from typing import Dict, Any, List, Optional
-from pptx.enum.shapes import MSO_SHAPE_TYPE
-from pptx.enum.dml import MSO_THEME_COLOR
-import warnings
+from bisect import bisect_left
+from copy import deepcopy
+from functools import lru_cache
+from math import isfinite
+from string import Template
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Mapping, Optional, Tuple
+import logging
+
+from lxml import etree
+from pptx.oxml import parse_xml
+
+logger = logging.getLogger(__name__)
+
+_P_NS = {"p": "http://schemas.openxmlformats.org/presentationml/2006/main"}
+
+# <p:timing> is always a direct child of <p:sld>, so anchor the lookups instead of scanning the subtree
+_FIND_MAIN_TIMING_PAR = etree.XPath("./p:timing/p:tnLst/p:par", namespaces=_P_NS)
+_FIND_CHILD_TNLST = etree.XPath("./p:childTnLst", namespaces=_P_NS)
+# A slide's transition is either a bare <p:transition> or one wrapped in mc:AlternateContent (p14 effects)
+_FIND_SLIDE_TRANSITIONS = etree.XPath(
+    "./p:transition | ./mc:AlternateContent[mc:Choice/p:transition]",
+    namespaces={**_P_NS, "mc": "http://schemas.openxmlformats.org/markup-compatibility/2006"}
+)
+
+# Clark-notation tags for building the timing skeleton without going through the XML parser
+_TAG_TIMING = "{%s}timing" % _P_NS["p"]
+_TAG_TNLST = "{%s}tnLst" % _P_NS["p"]
+_TAG_PAR = "{%s}par" % _P_NS["p"]
+_TAG_CTN = "{%s}cTn" % _P_NS["p"]
+_TAG_CHILD_TNLST = "{%s}childTnLst" % _P_NS["p"]
+
+# Upper duration bound (inclusive, in ms) for each PowerPoint transition speed
+_TRANSITION_SPEED_LIMITS_MS = (500, 1500)
+_TRANSITION_SPEEDS = ("fast", "med", "slow")
+
+_PML_NS = _P_NS["p"]
+_P14_NS = "http://schemas.microsoft.com/office/powerpoint/2010/main"
+_MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+# Shared wrappers; each transition below only supplies its effect element(s)
+_SIMPLE_TRANSITION_XML = (
+    f'<p:transition xmlns:p="{_PML_NS}" spd="$speed" p14:dur="$duration_ms" xmlns:p14="{_P14_NS}">'
+    '%s'
+    '</p:transition>'
+)
+_P14_TRANSITION_XML = (
+    f'<mc:AlternateContent xmlns:mc="{_MC_NS}">'
+    f'<mc:Choice xmlns:p14="{_P14_NS}" Requires="p14">'
+    f'<p:transition xmlns:p="{_PML_NS}" spd="$speed" p14:dur="$duration_ms">%s</p:transition>'
+    '</mc:Choice>'
+    '<mc:Fallback>'
+    f'<p:transition xmlns:p="{_PML_NS}" spd="$speed">%s</p:transition>'
+    '</mc:Fallback>'
+    '</mc:AlternateContent>'
+)
+
+_TRANSITION_TEMPLATES = {
+    "fade": Template(_SIMPLE_TRANSITION_XML % '<p:fade/>'),
+    "push": Template(_SIMPLE_TRANSITION_XML % '<p:push dir="l"/>'),
+    "wipe": Template(_SIMPLE_TRANSITION_XML % '<p:wipe dir="l"/>'),
+    "split": Template(_SIMPLE_TRANSITION_XML % '<p:split orient="horz" dir="out"/>'),
+    "reveal": Template(_SIMPLE_TRANSITION_XML % '<p:reveal dir="l"/>'),
+    # p14 transitions fall back to a plain p: effect for older PowerPoint versions
+    "zoom": Template(_P14_TRANSITION_XML % ('<p14:zoom/>', '<p:fade/>')),
+    "cube": Template(_P14_TRANSITION_XML % ('<p14:prism/>', '<p:fade/>')),
+    "flip": Template(_P14_TRANSITION_XML % ('<p14:flip/>', '<p:fade/>')),
+    "rotate": Template(_P14_TRANSITION_XML % ('<p14:doors/>', '<p:wipe dir="l"/>'))
+}
+
+# Trigger and effect mappings used when building shape animation XML
+_SHAPE_TRIGGER_TYPES = MappingProxyType({
+    "on_click": "onClick",
+    "with_previous": "withPrev", 
+    "after_previous": "afterPrev",
+    "on_page_click": "onClick"
+})
+
+_SHAPE_ANIMATION_EFFECTS = MappingProxyType({
+    "fade_in": {"type": "fade", "subtype": "none"},
+    "fly_in": {"type": "fly", "subtype": "left"},
+    "zoom": {"type": "zoom", "subtype": "in"},
+    "bounce": {"type": "bounce", "subtype": "none"},
+    "swivel": {"type": "swivel", "subtype": "none"},
+    "appear": {"type": "appear", "subtype": "none"},
+    "float_in": {"type": "float", "subtype": "up"},
+    "grow_and_turn": {"type": "growTurn", "subtype": "none"},
+    "spin": {"type": "spin", "subtype": "none"},
+    "move_left": {"type": "path", "subtype": "left"},
+    "move_right": {"type": "path", "subtype": "right"},
+    "move_up": {"type": "path", "subtype": "up"},
+    "move_down": {"type": "path", "subtype": "down"},
+    "move_diagonal": {"type": "path", "subtype": "diagonal"}
+})
+
+# Flattened views of the effect table: entrance effects map straight to their filter,
+# motion effects to their path direction, so the common case is a single lookup
+_SHAPE_EFFECT_FILTERS = MappingProxyType({
+    name: effect["type"] for name, effect in _SHAPE_ANIMATION_EFFECTS.items() if effect["type"] != "path"
+})
+_SHAPE_MOTION_DIRECTIONS = MappingProxyType({
+    name: effect["subtype"] for name, effect in _SHAPE_ANIMATION_EFFECTS.items() if effect["type"] == "path"
+})
+_DEFAULT_SHAPE_FILTER = _SHAPE_EFFECT_FILTERS["fade_in"]
+
+_EFFECT_TEMPLATE = Template(
+    f'<p:par xmlns:p="{_PML_NS}">'
+    '<p:cTn id="$par_id" fill="hold">'
+    '<p:stCondLst><p:cond evt="$trigger_type" delay="$delay_ms"/></p:stCondLst>'
+    '<p:childTnLst>'
+    '<p:animEffect transition="in" filter="$effect_type">'
+    '<p:cTn id="$effect_id" dur="$duration_ms"/>'
+    '<p:tgtEl><p:spTgt spid="$shape_id"/></p:tgtEl>'
+    '<p:animBhv>'
+    '<p:cTn id="$behavior_id" dur="$duration_ms"/>'
+    '<p:tgtEl><p:spTgt spid="$shape_id"/></p:tgtEl>'
+    '<p:attrNameLst><p:attrName>style.visibility</p:attrName></p:attrNameLst>'
+    '</p:animBhv>'
+    '</p:animEffect>'
+    '</p:childTnLst>'
+    '</p:cTn>'
+    '</p:par>'
+)
+
+# Use absolute coordinates for more reliable movement
+_MOTION_PATHS = MappingProxyType({
+    "left": "M 0 0 L -100 0 E",
+    "right": "M 0 0 L 100 0 E", 
+    "up": "M 0 0 L 0 -100 E",
+    "down": "M 0 0 L 0 100 E",
+    "diagonal": "M 0 0 L 100 100 E"
+})
+
+_MOTION_PATH_TEMPLATE = Template(
+    f'<p:par xmlns:p="{_PML_NS}">'
+    '<p:cTn id="$par_id" fill="hold">'
+    '<p:stCondLst><p:cond evt="$trigger_type" delay="$delay_ms"/></p:stCondLst>'
+    '<p:childTnLst>'
+    '<p:animMotion origin="layout" path="$path" pathEditMode="fixed" ptsTypes="">'
+    '<p:cBhvr>'
+    '<p:cTn id="$effect_id" dur="$duration_ms" fill="hold"/>'
+    '<p:tgtEl><p:spTgt spid="$shape_id"/></p:tgtEl>'
+    '</p:cBhvr>'
+    '</p:animMotion>'
+    '</p:childTnLst>'
+    '</p:cTn>'
+    '</p:par>'
+)
+
+# Lookup tables shared by every AnimationManager; built once at import and exposed read-only
+_TRANSITION_TYPES = MappingProxyType({
+    "none": 0,
+    "fade": 1,
+    "push": 2,
+    "wipe": 3,
+    "split": 4,
+    "reveal": 5,
+    "random_bars": 6,
+    "shape": 7,
+    "uncover": 8,
+    "cover": 9,
+    "cut": 10,
+    "fade_through_black": 11,
+    "zoom": 12,
+    "fly_through": 13,
+    "rotate": 14,
+    "newsflash": 15,
+    "alpha": 16,
+    "cube": 17,
+    "flip": 18,
+    "gallery": 19,
+    "conveyor": 20,
+    "pan": 21,
+    "glitter": 22,
+    "honeycomb": 23,
+    "flash": 24,
+    "shred": 25
+})
+
+_TRANSITION_NAMES = tuple(_TRANSITION_TYPES)
+
+# Animation presets for different effects
+_EFFECT_PRESETS = MappingProxyType({
+    "entrance": MappingProxyType({
+        "fade_in": MappingProxyType({"preset_id": "1", "preset_class": "entr", "preset_subtype": "0"}),
+        "fly_in_left": MappingProxyType({"preset_id": "2", "preset_class": "entr", "preset_subtype": "8"}),
+        "fly_in_right": MappingProxyType({"preset_id": "2", "preset_class": "entr", "preset_subtype": "2"}),
+        "fly_in_top": MappingProxyType({"preset_id": "2", "preset_class": "entr", "preset_subtype": "4"}),
+        "fly_in_bottom": MappingProxyType({"preset_id": "2", "preset_class": "entr", "preset_subtype": "6"}),
+        "zoom_in": MappingProxyType({"preset_id": "10", "preset_class": "entr", "preset_subtype": "0"}),
+        "bounce_in": MappingProxyType({"preset_id": "26", "preset_class": "entr", "preset_subtype": "0"})
+    }),
+    "emphasis": MappingProxyType({
+        "pulse": MappingProxyType({"preset_id": "1", "preset_class": "emph", "preset_subtype": "0"}),
+        "color_pulse": MappingProxyType({"preset_id": "2", "preset_class": "emph", "preset_subtype": "0"}),
+        "grow_shrink": MappingProxyType({"preset_id": "3", "preset_class": "emph", "preset_subtype": "0"}),
+        "spin": MappingProxyType({"preset_id": "5", "preset_class": "emph", "preset_subtype": "0"}),
+        "bounce": MappingProxyType({"preset_id": "26", "preset_class": "emph", "preset_subtype": "0"})
+    }),
+    "motion": MappingProxyType({
+        "move_left": MappingProxyType({"attr": "ppt_x", "from": "#ppt_x", "to": "#ppt_x-0.25"}),
+        "move_right": MappingProxyType({"attr": "ppt_x", "from": "#ppt_x", "to": "#ppt_x+0.25"}),
+        "move_up": MappingProxyType({"attr": "ppt_y", "from": "#ppt_y", "to": "#ppt_y-0.25"}),
+        "move_down": MappingProxyType({"attr": "ppt_y", "from": "#ppt_y", "to": "#ppt_y+0.25"}),
+        "move_diagonal": MappingProxyType({"attr": "ppt_x", "from": "#ppt_x", "to": "#ppt_x+0.25"}),
+        "custom_path": MappingProxyType({"attr": "custom", "from": "custom", "to": "custom"})
+    })
+})
+
+# Trigger event mappings
+_TRIGGER_EVENTS = MappingProxyType({
+    "on_click": "onNext",
+    "with_previous": "withPrev",
+    "after_previous": "afterPrev",
+    "on_page_click": "onNext",
+    "auto": "afterPrev"
+})
+
+_ANIMATION_TYPES = MappingProxyType({
+    # Entrance animations
+    "appear": MappingProxyType({"category": "entrance", "effect": 1}),
+    "fade_in": MappingProxyType({"category": "entrance", "effect": 2}),
+    "fly_in": MappingProxyType({"category": "entrance", "effect": 3}),
+    "float_in": MappingProxyType({"category": "entrance", "effect": 4}),
+    "split": MappingProxyType({"category": "entrance", "effect": 5}),
+    "wipe": MappingProxyType({"category": "entrance", "effect": 6}),
+    "shape": MappingProxyType({"category": "entrance", "effect": 7}),
+    "wheel": MappingProxyType({"category": "entrance", "effect": 8}),
+    "random_bars": MappingProxyType({"category": "entrance", "effect": 9}),
+    "grow_and_turn": MappingProxyType({"category": "entrance", "effect": 10}),
+    "zoom": MappingProxyType({"category": "entrance", "effect": 11}),
+    "swivel": MappingProxyType({"category": "entrance", "effect": 12}),
+    "bounce": MappingProxyType({"category": "entrance", "effect": 13}),
+
+    # Emphasis animations
+    "pulse": MappingProxyType({"category": "emphasis", "effect": 1}),
+    "color_pulse": MappingProxyType({"category": "emphasis", "effect": 2}),
+    "teeter": MappingProxyType({"category": "emphasis", "effect": 3}),
+    "spin": MappingProxyType({"category": "emphasis", "effect": 4}),
+    "grow_shrink": MappingProxyType({"category": "emphasis", "effect": 5}),
+    "desaturate": MappingProxyType({"category": "emphasis", "effect": 6}),
+    "darken": MappingProxyType({"category": "emphasis", "effect": 7}),
+    "lighten": MappingProxyType({"category": "emphasis", "effect": 8}),
+    "transparency": MappingProxyType({"category": "emphasis", "effect": 9}),
+    "object_color": MappingProxyType({"category": "emphasis", "effect": 10}),
+    "complementary_color": MappingProxyType({"category": "emphasis", "effect": 11}),
+    "line_color": MappingProxyType({"category": "emphasis", "effect": 12}),
+    "fill_color": MappingProxyType({"category": "emphasis", "effect": 13}),
+
+    # Exit animations
+    "disappear": MappingProxyType({"category": "exit", "effect": 1}),
+    "fade_out": MappingProxyType({"category": "exit", "effect": 2}),
+    "fly_out": MappingProxyType({"category": "exit", "effect": 3}),
+    "float_out": MappingProxyType({"category": "exit", "effect": 4}),
+    "split_out": MappingProxyType({"category": "exit", "effect": 5}),
+    "wipe_out": MappingProxyType({"category": "exit", "effect": 6}),
+    "shape_out": MappingProxyType({"category": "exit", "effect": 7}),
+    "random_bars_out": MappingProxyType({"category": "exit", "effect": 8}),
+    "shrink_and_turn": MappingProxyType({"category": "exit", "effect": 9}),
+    "zoom_out": MappingProxyType({"category": "exit", "effect": 10}),
+    "swivel_out": MappingProxyType({"category": "exit", "effect": 11}),
+    "bounce_out": MappingProxyType({"category": "exit", "effect": 12})
+})
+
+
+def _group_animations_by_category() -> Mapping[str, Tuple[str, ...]]:
+    grouped = {"entrance": [], "emphasis": [], "exit": []}
+    for anim_name, anim_info in _ANIMATION_TYPES.items():
+        grouped[anim_info["category"]].append(anim_name)
+    return MappingProxyType({category: tuple(names) for category, names in grouped.items()})
+
+
+_ANIMATIONS_BY_CATEGORY = _group_animations_by_category()
+
+_TIMING_OPTIONS = MappingProxyType({
+    "very_fast": 0.5,
+    "fast": 1.0,
+    "medium": 2.0,
+    "slow": 3.0,
+    "very_slow": 5.0
+})
+
+# Per-direction motion XML with the path baked in; the remaining holes are positional, in document
+# order: par id, trigger, delay, effect id, duration, shape id
+_MOTION_PATH_FORMATS = MappingProxyType({
+    direction: _MOTION_PATH_TEMPLATE.substitute(
+        path=path, par_id="%s", trigger_type="%s", delay_ms="%s", effect_id="%s", duration_ms="%s", shape_id="%s"
+    )
+    for direction, path in _MOTION_PATHS.items()
+})
+_DEFAULT_MOTION_PATH_FORMAT = _MOTION_PATH_FORMATS["right"]
+
+# Preset tables are shared between callers, so every entry is a read-only view
+_TRANSITION_PRESETS = MappingProxyType({
+    "smooth": MappingProxyType({"type": "fade", "duration": "medium"}),
+    "dynamic": MappingProxyType({"type": "zoom", "duration": "fast"}),
+    "professional": MappingProxyType({"type": "wipe", "duration": "medium"}),
+    "creative": MappingProxyType({"type": "cube", "duration": "slow"}),
+    "minimal": MappingProxyType({"type": "fade", "duration": "fast"})
+})
+
+_ANIMATION_PRESETS = MappingProxyType({
+    "slide_in": MappingProxyType({"type": "fly_in", "duration": "medium", "trigger": "on_click"}),
+    "fade_in": MappingProxyType({"type": "fade_in", "duration": "medium", "trigger": "on_click"}),
+    "zoom_in": MappingProxyType({"type": "zoom", "duration": "fast", "trigger": "on_click"}),
+    "bounce_in": MappingProxyType({"type": "bounce", "duration": "medium", "trigger": "on_click"}),
+    "spin_in": MappingProxyType({"type": "swivel", "duration": "medium", "trigger": "on_click"}),
+    "auto_fade": MappingProxyType({
+        "type": "fade_in",
+        "duration": "medium",
+        "trigger": "after_previous",
+        "delay": 0.5
+    }),
+    "sequence_fade": MappingProxyType({
+        "type": "fade_in",
+        "duration": "fast",
+        "trigger": "after_previous",
+        "delay": 0.3
+    })
+})
+
+
+def _thaw_preset(preset: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Plain-dict copy of a frozen preset, so callers can serialize or tweak it freely."""
+    if preset is None:
+        return None
+    return {key: _thaw_preset(value) if isinstance(value, Mapping) else value for key, value in preset.items()}
+
+
+_SEQUENCE_PRESETS = MappingProxyType({
+    "cascade": MappingProxyType({
+        "type": "sequential",
+        "base_delay": 0,
+        "delay_increment": 0.3,
+        "animation": MappingProxyType({"type": "fade_in", "duration": "fast", "trigger": "after_previous"})
+    }),
+    "simultaneous": MappingProxyType({
+        "type": "simultaneous",
+        "base_delay": 0,
+        "delay_increment": 0,
+        "animation": MappingProxyType({"type": "zoom", "duration": "medium", "trigger": "on_click"})
+    }),
+    "wave": MappingProxyType({
+        "type": "sequential",
+        "base_delay": 0,
+        "delay_increment": 0.2,
+        "animation": MappingProxyType({"type": "fly_in", "duration": "fast", "trigger": "after_previous"})
+    })
+})
+
+
+def _fill_shape_ids(xml: str, shape_id: int) -> str:
+    """Fill in the timing node ids a shape's animation XML is targeted by."""
+    # Plain replaces on the few remaining placeholders; none of the names is a prefix of another
+    return (xml.replace("$par_id", str(shape_id + 100))
+               .replace("$effect_id", str(shape_id + 200))
+               .replace("$behavior_id", str(shape_id + 300))
+               .replace("$shape_id", str(shape_id)))
+
+
+@lru_cache(maxsize=128)
+def _parsed_fragment(xml: str):
+    """Parse an XML fragment once; callers must insert a deep copy of the result."""
+    return parse_xml(xml)
+
+
+@lru_cache(maxsize=256)
+def _effect_template(effect_type: str, duration_ms: int, delay_ms: int, trigger_type: str) -> str:
+    """Fill in the shape-independent parts of the effect XML; shape ids stay as placeholders."""
+    return _EFFECT_TEMPLATE.safe_substitute(
+        effect_type=effect_type, duration_ms=duration_ms, delay_ms=delay_ms, trigger_type=trigger_type
+    )
+
+
+def _no_visual_effect(shape, animation_config) -> None:
+    pass
+
+
+# Initial-state tweaks that could simulate an animation with plain formatting; none is implemented yet:
+#   fade_in/appear  - start with low transparency, but python-pptx transparency support is limited
+#   zoom            - adjust the initial size; this would require storing original dimensions
+#   fly_in/float_in - adjust the initial position; this would require storing target position
+_VISUAL_EFFECT_HANDLERS = MappingProxyType({
+    "fade_in": _no_visual_effect,
+    "appear": _no_visual_effect,
+    "zoom": _no_visual_effect,
+    "fly_in": _no_visual_effect,
+    "float_in": _no_visual_effect
+})
+
+
+# Sentinel for config keys that are absent, so they are not confused with an explicit None
+_MISSING = object()
+
+_VALID_TRIGGERS = frozenset({"on_click", "with_previous", "after_previous", "on_page_click"})
+
+
+def _is_valid_duration(manager_cls, duration) -> bool:
+    """Duration is either a named timing option or a number of seconds."""
+    if isinstance(duration, str):
+        return duration in manager_cls.timing_options
+    return isinstance(duration, (int, float))
+
+
+def _is_known_animation(manager_cls, anim_type) -> bool:
+    return anim_type in manager_cls.animation_types
+
+
+def _is_known_transition(manager_cls, transition_type) -> bool:
+    return transition_type in manager_cls.transition_types
+
+
+def _is_valid_trigger(manager_cls, trigger) -> bool:
+    try:
+        return trigger in _VALID_TRIGGERS
+    except TypeError:
+        # Unhashable values (e.g. a list) are simply not valid triggers
+        return False
+
+
+# Each validator is a table of (config key, predicate); keys absent from a config are not checked
+_ANIMATION_VALIDATORS = (
+    ("type", _is_known_animation),
+    ("duration", _is_valid_duration),
+    ("trigger", _is_valid_trigger),
+)
+_TRANSITION_VALIDATORS = (
+    ("type", _is_known_transition),
+    ("duration", _is_valid_duration),
+)
+
+
+def _check_fields(manager_cls, validators, values) -> bool:
+    for (_, is_valid), value in zip(validators, values):
+        if value is not _MISSING and not is_valid(manager_cls, value):
+            return False
+    return True
+
+
+def _is_finite_number(value) -> bool:
+    """True for ints and finite floats, i.e. values that convert cleanly to milliseconds."""
+    return isinstance(value, int) or (isinstance(value, float) and isfinite(value))
+
+
+# Keyed on the manager class as well, so subclasses with their own tables get separate entries
+_cached_check_fields = lru_cache(maxsize=2048)(_check_fields)
 
 
 class AnimationManager:
     """Manages animations for PowerPoint presentations with flexible customization."""
     
-    def __init__(self):
-        """Initialize the animation manager."""
-        self.timing_options = {
-            "very_fast": 0.25,
-            "fast": 0.5,
-            "medium": 1.0,
-            "slow": 2.0,
-            "very_slow": 3.0
-        }
+    __slots__ = ()
+    
+    animation_presets = _EFFECT_PRESETS
+    trigger_events = _TRIGGER_EVENTS
+    transition_types = _TRANSITION_TYPES
+    animation_types = _ANIMATION_TYPES
+    timing_options = _TIMING_OPTIONS
+    
+    def apply_slide_transition(self, slide, transition_config: Dict[str, Any]) -> None:
+        """Apply transition effect to slide using XML injection."""
+        if not isinstance(transition_config, Mapping):
+            logger.warning("Ignoring slide transition with invalid config: %r", transition_config)
+            return
         
-        # Animation presets for different effects
-        self.animation_presets = {
-            "entrance": {
-                "fade_in": {"preset_id": "1", "preset_class": "entr", "preset_subtype": "0"},
-                "fly_in_left": {"preset_id": "2", "preset_class": "entr", "preset_subtype": "8"},
-                "fly_in_right": {"preset_id": "2", "preset_class": "entr", "preset_subtype": "2"},
-                "fly_in_top": {"preset_id": "2", "preset_class": "entr", "preset_subtype": "4"},
-                "fly_in_bottom": {"preset_id": "2", "preset_class": "entr", "preset_subtype": "6"},
-                "zoom_in": {"preset_id": "10", "preset_class": "entr", "preset_subtype": "0"},
-                "bounce_in": {"preset_id": "26", "preset_class": "entr", "preset_subtype": "0"}
-            },
-            "emphasis": {
-                "pulse": {"preset_id": "1", "preset_class": "emph", "preset_subtype": "0"},
-                "color_pulse": {"preset_id": "2", "preset_class": "emph", "preset_subtype": "0"},
-                "grow_shrink": {"preset_id": "3", "preset_class": "emph", "preset_subtype": "0"},
-                "spin": {"preset_id": "5", "preset_class": "emph", "preset_subtype": "0"},
-                "bounce": {"preset_id": "26", "preset_class": "emph", "preset_subtype": "0"}
-            },
-            "motion": {
-                "move_left": {"attr": "ppt_x", "from": "#ppt_x", "to": "#ppt_x-0.25"},
-                "move_right": {"attr": "ppt_x", "from": "#ppt_x", "to": "#ppt_x+0.25"},
-                "move_up": {"attr": "ppt_y", "from": "#ppt_y", "to": "#ppt_y-0.25"},
-                "move_down": {"attr": "ppt_y", "from": "#ppt_y", "to": "#ppt_y+0.25"},
-                "move_diagonal": {"attr": "ppt_x", "from": "#ppt_x", "to": "#ppt_x+0.25"},
-                "custom_path": {"attr": "custom", "from": "custom", "to": "custom"}
-            }
-        }
+        transition_type = transition_config.get("type", "none")
+        duration = transition_config.get("duration", 1.0)
+        if not isinstance(transition_type, str):
+            logger.warning("Ignoring slide transition with invalid type: %r", transition_type)
+            return
         
-        # Trigger event mappings
-        self.trigger_events = {
-            "on_click": "onNext",
-            "with_previous": "withPrev",
-            "after_previous": "afterPrev",
-            "on_page_click": "onNext",
-            "auto": "afterPrev"
-        }
+        # Convert string duration to float if needed
+        if isinstance(duration, str):
+            duration = self.timing_options.get(duration, 1.0)
+        elif not _is_finite_number(duration):
+            logger.warning("Ignoring slide transition with invalid duration: %r", duration)
+            return
         
-        self.transition_types = {
-            "none": 0,
-            "fade": 1,
-            "push": 2,
-            "wipe": 3,
-            "split": 4,
-            "reveal": 5,
-            "random_bars": 6,
-            "shape": 7,
-            "uncover": 8,
-            "cover": 9,
-            "cut": 10,
-            "fade_through_black": 11,
-            "zoom": 12,
-            "fly_through": 13,
-            "rotate": 14,
-            "newsflash": 15,
-            "alpha": 16,
-            "cube": 17,
-            "flip": 18,
-            "gallery": 19,
-            "conveyor": 20,
-            "pan": 21,
-            "glitter": 22,
-            "honeycomb": 23,
-            "flash": 24,
-            "shred": 25
-        }
+        # Convert duration to milliseconds for PowerPoint
+        duration_ms = int(duration * 1000)
         
-        self.animation_types = {
-            # Entrance animations
-            "appear": {"category": "entrance", "effect": 1},
-            "fade_in": {"category": "entrance", "effect": 2},
-            "fly_in": {"category": "entrance", "effect": 3},
-            "float_in": {"category": "entrance", "effect": 4},
-            "split": {"category": "entrance", "effect": 5},
-            "wipe": {"category": "entrance", "effect": 6},
-            "shape": {"category": "entrance", "effect": 7},
-            "wheel": {"category": "entrance", "effect": 8},
-            "random_bars": {"category": "entrance", "effect": 9},
-            "grow_and_turn": {"category": "entrance", "effect": 10},
-            "zoom": {"category": "entrance", "effect": 11},
-            "swivel": {"category": "entrance", "effect": 12},
-            "bounce": {"category": "entrance", "effect": 13},
-            
-            # Emphasis animations
-            "pulse": {"category": "emphasis", "effect": 1},
-            "color_pulse": {"category": "emphasis", "effect": 2},
-            "teeter": {"category": "emphasis", "effect": 3},
-            "spin": {"category": "emphasis", "effect": 4},
-            "grow_shrink": {"category": "emphasis", "effect": 5},
-            "desaturate": {"category": "emphasis", "effect": 6},
-            "darken": {"category": "emphasis", "effect": 7},
-            "lighten": {"category": "emphasis", "effect": 8},
-            "transparency": {"category": "emphasis", "effect": 9},
-            "object_color": {"category": "emphasis", "effect": 10},
-            "complementary_color": {"category": "emphasis", "effect": 11},
-            "line_color": {"category": "emphasis", "effect": 12},
-            "fill_color": {"category": "emphasis", "effect": 13},
-            
-            # Exit animations
-            "disappear": {"category": "exit", "effect": 1},
-            "fade_out": {"category": "exit", "effect": 2},
-            "fly_out": {"category": "exit", "effect": 3},
-            "float_out": {"category": "exit", "effect": 4},
-            "split_out": {"category": "exit", "effect": 5},
-            "wipe_out": {"category": "exit", "effect": 6},
-            "shape_out": {"category": "exit", "effect": 7},
-            "random_bars_out": {"category": "exit", "effect": 8},
-            "shrink_and_turn": {"category": "exit", "effect": 9},
-            "zoom_out": {"category": "exit", "effect": 10},
-            "swivel_out": {"category": "exit", "effect": 11},
-            "bounce_out": {"category": "exit", "effect": 12}
-        }
+        # Get XML template for transition
+        transition_xml = self._get_transition_xml(transition_type, duration_ms)
+        if not transition_xml:
+            return
         
-        self.timing_options = {
-            "very_fast": 0.5,
-            "fast": 1.0,
-            "medium": 2.0,
-            "slow": 3.0,
-            "very_slow": 5.0
-        }
-    
-    def apply_slide_transition(self, slide, transition_config: Dict[str, Any]) -> None:
-        """Apply transition effect to slide using XML injection."""
+        # Parse (once per distinct XML) and inject a copy into the slide
         try:
-            from pptx.oxml import parse_xml
-            
-            transition_type = transition_config.get("type", "none")
-            duration = transition_config.get("duration", 1.0)
-            
-            # Convert string duration to float if needed
-            if isinstance(duration, str):
-                duration = self.timing_options.get(duration, 1.0)
-            
-            # Convert duration to milliseconds for PowerPoint
-            duration_ms = int(duration * 1000)
-            
-            # Get XML template for transition
-            transition_xml = self._get_transition_xml(transition_type, duration_ms)
-            
-            if transition_xml:
-                # Parse and inject XML into slide
-                xml_fragment = parse_xml(transition_xml)
-                slide.element.insert(-1, xml_fragment)
-                    
+            xml_fragment = deepcopy(_parsed_fragment(transition_xml))
+            # A slide holds a single transition; re-applying replaces it rather than stacking another
+            for existing in _FIND_SLIDE_TRANSITIONS(slide.element):
+                slide.element.remove(existing)
+            slide.element.insert(-1, xml_fragment)
         except Exception as e:
-            warnings.warn(f"Failed to apply slide transition: {e}")
+            logger.warning("Failed to apply slide transition: %s", e)
     
     def _get_transition_xml(self, transition_type: str, duration_ms: int) -> str:
         """Get XML template for specific transition type."""
         # Speed mapping for PowerPoint
-        if duration_ms <= 500:
-            speed = "fast"
-        elif duration_ms <= 1500:
-            speed = "med"
-        else:
-            speed = "slow"
-        
-        transition_templates = {
-            "fade": f'''
-                <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}" p14:dur="{duration_ms}" xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main">
-                    <p:fade />
-                </p:transition>
-            ''',
-            "push": f'''
-                <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}" p14:dur="{duration_ms}" xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main">
-                    <p:push dir="l" />
-                </p:transition>
-            ''',
-            "wipe": f'''
-                <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}" p14:dur="{duration_ms}" xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main">
-                    <p:wipe dir="l" />
-                </p:transition>
-            ''',
-            "split": f'''
-                <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}" p14:dur="{duration_ms}" xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main">
-                    <p:split orient="horz" dir="out" />
-                </p:transition>
-            ''',
-            "reveal": f'''
-                <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}" p14:dur="{duration_ms}" xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main">
-                    <p:reveal dir="l" />
-                </p:transition>
-            ''',
-            "zoom": f'''
-                <mc:AlternateContent xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">
-                    <mc:Choice xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main" Requires="p14">
-                        <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}" p14:dur="{duration_ms}">
-                            <p14:zoom />
-                        </p:transition>
-                    </mc:Choice>
-                    <mc:Fallback>
-                        <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}">
-                            <p:fade />
-                        </p:transition>
-                    </mc:Fallback>
-                </mc:AlternateContent>
-            ''',
-            "cube": f'''
-                <mc:AlternateContent xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">
-                    <mc:Choice xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main" Requires="p14">
-                        <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}" p14:dur="{duration_ms}">
-                            <p14:prism />
-                        </p:transition>
-                    </mc:Choice>
-                    <mc:Fallback>
-                        <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}">
-                            <p:fade />
-                        </p:transition>
-                    </mc:Fallback>
-                </mc:AlternateContent>
-            ''',
-            "flip": f'''
-                <mc:AlternateContent xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">
-                    <mc:Choice xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main" Requires="p14">
-                        <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}" p14:dur="{duration_ms}">
-                            <p14:flip />
-                        </p:transition>
-                    </mc:Choice>
-                    <mc:Fallback>
-                        <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}">
-                            <p:fade />
-                        </p:transition>
-                    </mc:Fallback>
-                </mc:AlternateContent>
-            ''',
-            "rotate": f'''
-                <mc:AlternateContent xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">
-                    <mc:Choice xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main" Requires="p14">
-                        <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}" p14:dur="{duration_ms}">
-                            <p14:doors />
-                        </p:transition>
-                    </mc:Choice>
-                    <mc:Fallback>
-                        <p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="{speed}">
-                            <p:wipe dir="l" />
-                        </p:transition>
-                    </mc:Fallback>
-                </mc:AlternateContent>
-            '''
-        }
+        speed = _TRANSITION_SPEEDS[bisect_left(_TRANSITION_SPEED_LIMITS_MS, duration_ms)]
         
-        return transition_templates.get(transition_type, "")
+        template = _TRANSITION_TEMPLATES.get(transition_type)
+        if template is None:
+            return ""
+        return template.substitute(speed=speed, duration_ms=duration_ms)
     
     def apply_shape_animation(self, slide, shape, animation_config: Dict[str, Any]) -> None:
         """Apply animation to shape with simplified approach."""
+        if not isinstance(animation_config, Mapping):
+            logger.warning("Ignoring shape animation with invalid config: %r", animation_config)
+            return
+        
+        animation_type, duration, trigger = self._resolve_animation(animation_config)
+        delay = animation_config.get("delay", 0)
+        
+        # Apply simple animation without complex XML injection; failures are reported here, once,
+        # rather than by each helper underneath
         try:
-            # Parse animation configuration
-            animation_type = animation_config.get("type", "fade_in")
-            delay = animation_config.get("delay", 0)
-            duration = animation_config.get("duration", "medium")
-            trigger = animation_config.get("trigger", "on_click")
-            
-            # Convert string duration to float
-            if isinstance(duration, str):
-                duration = self.timing_options.get(duration, 1.0)
-            
-            # Apply simple animation without complex XML injection
             self._apply_simple_animation(slide, shape, animation_type, duration, delay, trigger)
-                    
         except Exception as e:
-            warnings.warn(f"Failed to apply shape animation: {e}")
+            logger.warning("Failed to apply shape animation: %s", e)
+    
+    def _resolve_animation(self, animation_config: Mapping[str, Any]):
+        """Resolve the delay-independent settings of an animation config."""
+        animation_type = animation_config.get("type", "fade_in")
+        duration = animation_config.get("duration", "medium")
+        trigger = animation_config.get("trigger", "on_click")
+        
+        # Convert string duration to float
+        if isinstance(duration, str):
+            duration = self.timing_options.get(duration, 1.0)
+        
+        return animation_type, duration, trigger
     
     def _apply_simple_animation(self, slide, shape, animation_type: str, duration: float, delay: float, trigger: str):
         """Apply simple animation without complex XML injection."""
-        try:
-            # For now, just log the animation request without breaking the presentation
-            # This ensures presentations generate successfully without animation errors
-            pass
-        except Exception as e:
-            warnings.warn(f"Failed to apply simple animation: {e}")
-    
+        # For now, just accept the animation request without touching the slide XML
+        # This ensures presentations generate successfully without animation errors
+        pass
     
     def _get_or_create_timing_element(self, slide):
         """Get or create timing element in slide for animations."""
-        try:
-            from pptx.oxml import parse_xml
-            
-            # Check if timing element exists
-            timing_elements = slide.element.xpath('.//p:timing')
-            if timing_elements:
-                # Get the main sequence container
-                tnlst = timing_elements[0].xpath('.//p:tnLst')[0]
-                main_par = tnlst.xpath('.//p:par')[0]
-                childtnlst = main_par.xpath('.//p:childTnLst')
-                if childtnlst:
-                    return childtnlst[0]
-                else:
-                    # Create childTnLst if it doesn't exist
-                    child_xml = '<p:childTnLst xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"/>'
-                    child_fragment = parse_xml(child_xml)
-                    main_par.append(child_fragment)
-                    return child_fragment
-            
+        slide_element = slide.element
+        
+        # Check if timing element exists
+        main_pars = _FIND_MAIN_TIMING_PAR(slide_element)
+        if main_pars:
+            # Get the main sequence container
+            main_par = main_pars[0]
+            childtnlst = _FIND_CHILD_TNLST(main_par)
+            if childtnlst:
+                container = childtnlst[0]
+            else:
+                # Create childTnLst if it doesn't exist
+                container = etree.SubElement(main_par, _TAG_CHILD_TNLST)
+        else:
             # Create complete timing structure if it doesn't exist
-            timing_xml = '''
-                <p:timing xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
-                    <p:tnLst>
-                        <p:par>
-                            <p:cTn id="1" dur="indefinite" restart="never" nodeType="tmRoot"/>
-                            <p:childTnLst>
-                            </p:childTnLst>
-                        </p:par>
-                    </p:tnLst>
-                </p:timing>
-            '''
-            timing_fragment = parse_xml(timing_xml)
-            slide.element.append(timing_fragment)
-            
-            return slide.element.xpath('.//p:childTnLst')[0]
-            
-        except Exception as e:
-            warnings.warn(f"Failed to create timing element: {e}")
-            return None
+            timing = etree.SubElement(slide_element, _TAG_TIMING)
+            root_par = etree.SubElement(etree.SubElement(timing, _TAG_TNLST), _TAG_PAR)
+            etree.SubElement(root_par, _TAG_CTN, id="1", dur="indefinite", restart="never", nodeType="tmRoot")
+            container = etree.SubElement(root_par, _TAG_CHILD_TNLST)
+        
+        return container
     
     def _get_shape_animation_xml(self, shape, animation_type: str, duration: float, delay: float, trigger: str) -> str:
         """Get XML for shape animation."""
+        if not (isinstance(animation_type, str) and isinstance(trigger, str)
+                and _is_finite_number(duration) and _is_finite_number(delay)):
+            logger.warning("Ignoring shape animation with invalid settings: %r", (animation_type, duration, delay, trigger))
+            return ""
+        
         # Convert duration to milliseconds
         duration_ms = int(duration * 1000)
         delay_ms = int(delay * 1000)
         
         # Get shape ID for targeting
-        shape_id = shape.shape_id if hasattr(shape, 'shape_id') else 1
-        
-        # Map trigger types
-        trigger_map = {
-            "on_click": "onClick",
-            "with_previous": "withPrev", 
-            "after_previous": "afterPrev",
-            "on_page_click": "onClick"
-        }
-        trigger_type = trigger_map.get(trigger, "onClick")
+        shape_id = getattr(shape, 'shape_id', 1)
         
-        # Animation effect mapping
-        animation_effects = {
-            "fade_in": {"type": "fade", "subtype": "none"},
-            "fly_in": {"type": "fly", "subtype": "left"},
-            "zoom": {"type": "zoom", "subtype": "in"},
-            "bounce": {"type": "bounce", "subtype": "none"},
-            "swivel": {"type": "swivel", "subtype": "none"},
-            "appear": {"type": "appear", "subtype": "none"},
-            "float_in": {"type": "float", "subtype": "up"},
-            "grow_and_turn": {"type": "growTurn", "subtype": "none"},
-            "spin": {"type": "spin", "subtype": "none"},
-            "move_left": {"type": "path", "subtype": "left"},
-            "move_right": {"type": "path", "subtype": "right"},
-            "move_up": {"type": "path", "subtype": "up"},
-            "move_down": {"type": "path", "subtype": "down"},
-            "move_diagonal": {"type": "path", "subtype": "diagonal"}
-        }
+        trigger_type = _SHAPE_TRIGGER_TYPES.get(trigger, "onClick")
         
-        effect = animation_effects.get(animation_type, {"type": "fade", "subtype": "none"})
+        effect_type = _SHAPE_EFFECT_FILTERS.get(animation_type)
+        if effect_type is None:
+            # Handle motion path animations differently
+            direction = _SHAPE_MOTION_DIRECTIONS.get(animation_type)
+            if direction is not None:
+                return self._get_motion_path_xml(shape_id, direction, duration_ms, delay_ms, trigger_type)
+            effect_type = _DEFAULT_SHAPE_FILTER
         
-        # Handle motion path animations differently
-        if effect["type"] == "path":
-            animation_xml = self._get_motion_path_xml(shape_id, effect["subtype"], duration_ms, delay_ms, trigger_type)
-        else:
-            animation_xml = f'''
-                <p:par xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
-                    <p:cTn id="{shape_id + 100}" fill="hold">
-                        <p:stCondLst>
-                            <p:cond evt="{trigger_type}" delay="{delay_ms}"/>
-                        </p:stCondLst>
-                        <p:childTnLst>
-                            <p:animEffect transition="in" filter="{effect['type']}">
-                                <p:cTn id="{shape_id + 200}" dur="{duration_ms}"/>
-                                <p:tgtEl>
-                                    <p:spTgt spid="{shape_id}"/>
-                                </p:tgtEl>
-                                <p:animBhv>
-                                    <p:cTn id="{shape_id + 300}" dur="{duration_ms}"/>
-                                    <p:tgtEl>
-                                        <p:spTgt spid="{shape_id}"/>
-                                    </p:tgtEl>
-                                    <p:attrNameLst>
-                                        <p:attrName>style.visibility</p:attrName>
-                                    </p:attrNameLst>
-                                </p:animBhv>
-                            </p:animEffect>
-                        </p:childTnLst>
-                    </p:cTn>
-                </p:par>
-            '''
-        
-        return animation_xml
+        return _fill_shape_ids(_effect_template(effect_type, duration_ms, delay_ms, trigger_type), shape_id)
     
     def _get_motion_path_xml(self, shape_id: int, direction: str, duration_ms: int, delay_ms: int, trigger_type: str) -> str:
         """Generate XML for motion path animations."""
-        # Use absolute coordinates for more reliable movement
-        motion_paths = {
-            "left": "M 0 0 L -100 0 E",
-            "right": "M 0 0 L 100 0 E", 
-            "up": "M 0 0 L 0 -100 E",
-            "down": "M 0 0 L 0 100 E",
-            "diagonal": "M 0 0 L 100 100 E"
-        }
-        
-        path = motion_paths.get(direction, "M 0 0 L 100 0 E")
-        
-        return f'''
-            <p:par xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
-                <p:cTn id="{shape_id + 100}" fill="hold">
-                    <p:stCondLst>
-                        <p:cond evt="{trigger_type}" delay="{delay_ms}"/>
-                    </p:stCondLst>
-                    <p:childTnLst>
-                        <p:animMotion origin="layout" path="{path}" pathEditMode="fixed" ptsTypes="">
-                            <p:cBhvr>
-                                <p:cTn id="{shape_id + 200}" dur="{duration_ms}" fill="hold"/>
-                                <p:tgtEl>
-                                    <p:spTgt spid="{shape_id}"/>
-                                </p:tgtEl>
-                            </p:cBhvr>
-                        </p:animMotion>
-                    </p:childTnLst>
-                </p:cTn>
-            </p:par>
-        '''
+        motion_format = _MOTION_PATH_FORMATS.get(direction, _DEFAULT_MOTION_PATH_FORMAT)
+        return motion_format % (shape_id + 100, trigger_type, delay_ms, shape_id + 200, duration_ms, shape_id)
     
     def _apply_visual_effects(self, shape, animation_config: Dict[str, Any]) -> None:
         """Apply visual effects that can be simulated with formatting."""
         animation_type = animation_config.get("type", "appear")
         
         # Apply initial state based on animation type
-        if animation_type in ["fade_in", "appear"]:
-            # For fade in, we could start with low transparency
-            # but python-pptx transparency support is limited
-            pass
-        elif animation_type == "zoom":
-            # For zoom, we could adjust initial size
-            # This would require storing original dimensions
-            pass
-        elif animation_type in ["fly_in", "float_in"]:
-            # For fly in, we could adjust initial position
-            # This would require storing target position
-            pass
+        _VISUAL_EFFECT_HANDLERS.get(animation_type, _no_visual_effect)(shape, animation_config)
     
-    def create_animation_sequence(self, shapes: List[Any], sequence_config: Dict[str, Any]) -> None:
+    def create_animation_sequence(self, shapes: Iterable[Any], sequence_config: Dict[str, Any]) -> None:
         """Create animation sequence for multiple shapes."""
         sequence_type = sequence_config.get("type", "sequential")
         base_delay = sequence_config.get("base_delay", 0)
         delay_increment = sequence_config.get("delay_increment", 0.5)
         
-        for i, shape in enumerate(shapes):
-            if sequence_type == "sequential":
-                delay = base_delay + (i * delay_increment)
-            elif sequence_type == "simultaneous":
-                delay = base_delay
-            elif sequence_type == "reverse":
-                delay = base_delay + ((len(shapes) - 1 - i) * delay_increment)
-            else:
-                delay = base_delay
-            
-            # Apply animation with calculated delay
-            animation_config = sequence_config.get("animation", {}).copy()
-            animation_config["delay"] = delay
-            
-            self.apply_shape_animation(shape, animation_config)
-    
-    def get_available_transitions(self) -> List[str]:
-        """Get list of available transition types."""
-        return list(self.transition_types.keys())
-    
-    def get_available_animations(self) -> Dict[str, List[str]]:
-        """Get list of available animations by category."""
-        animations_by_category = {
-            "entrance": [],
-            "emphasis": [],
-            "exit": []
-        }
+        # Materialize once so any iterable (e.g. a generator over slide.shapes) can be sized and indexed
+        shapes = tuple(shapes)
+        if not shapes:
+            return
         
-        for anim_name, anim_info in self.animation_types.items():
-            category = anim_info["category"]
-            animations_by_category[category].append(anim_name)
+        # A sequence animates shapes of one slide with one animation; resolve both once for the whole batch
+        slide = shapes[0].part.slide
+        animation_type, duration, trigger = self._resolve_animation(sequence_config.get("animation", {}))
         
-        return animations_by_category
+        # Branch on the sequence type once, not per shape
+        count = len(shapes)
+        if sequence_type == "sequential":
+            delays = [base_delay + (i * delay_increment) for i in range(count)]
+        elif sequence_type == "reverse":
+            delays = [base_delay + (i * delay_increment) for i in range(count - 1, -1, -1)]
+        else:
+            delays = [base_delay] * count
+        
+        # One handler for the whole batch, so a systematic failure is logged once rather than per shape
+        try:
+            for shape, delay in zip(shapes, delays):
+                # Apply animation with calculated delay
+                self._apply_simple_animation(slide, shape, animation_type, duration, delay, trigger)
+        except Exception as e:
+            logger.warning("Failed to apply animation sequence: %s", e)
+    
+    def get_available_transitions(self) -> Tuple[str, ...]:
+        """Get available transition types."""
+        return _TRANSITION_NAMES
     
-    def validate_animation_config(self, config: Dict[str, Any]) -> bool:
+    def get_available_animations(self) -> Mapping[str, Tuple[str, ...]]:
+        """Get available animations by category."""
+        return _ANIMATIONS_BY_CATEGORY
+    
+    def validate_animation_config(self, config: Mapping[str, Any]) -> bool:
         """Validate animation configuration."""
-        if "type" in config:
-            if config["type"] not in self.animation_types:
-                return False
-        
-        if "duration" in config:
-            duration = config["duration"]
-            if isinstance(duration, str):
-                if duration not in self.timing_options:
-                    return False
-            elif not isinstance(duration, (int, float)):
-                return False
-        
-        if "trigger" in config:
-            valid_triggers = ["on_click", "with_previous", "after_previous", "on_page_click"]
-            if config["trigger"] not in valid_triggers:
-                return False
-        
-        return True
+        return self._validate_config(config, _ANIMATION_VALIDATORS)
     
-    def validate_transition_config(self, config: Dict[str, Any]) -> bool:
+    def validate_transition_config(self, config: Mapping[str, Any]) -> bool:
         """Validate transition configuration."""
-        if "type" in config:
-            if config["type"] not in self.transition_types:
-                return False
-        
-        if "duration" in config:
-            duration = config["duration"]
-            if isinstance(duration, str):
-                if duration not in self.timing_options:
-                    return False
-            elif not isinstance(duration, (int, float)):
-                return False
-        
-        return True
+        return self._validate_config(config, _TRANSITION_VALIDATORS)
+    
+    def _validate_config(self, config: Mapping[str, Any], validators) -> bool:
+        values = tuple(config.get(key, _MISSING) for key, _ in validators)
+        try:
+            return _cached_check_fields(type(self), validators, values)
+        except TypeError:
+            # Unhashable field values can't be cached; validate them directly
+            return _check_fields(type(self), validators, values)
+
+
+# Shared by every engine: the tables are class-level constants and instances hold no state
+ANIMATION_MANAGER = AnimationManager()
 
 
 class TransitionPresets:
     """Predefined transition configurations."""
     
+    __slots__ = ()
+    
     @staticmethod
     def get_preset(preset_name: str) -> Optional[Dict[str, Any]]:
         """Get predefined transition configuration."""
-        presets = {
-            "smooth": {
-                "type": "fade",
-                "duration": "medium"
-            },
-            "dynamic": {
-                "type": "zoom",
-                "duration": "fast"
-            },
-            "professional": {
-                "type": "wipe",
-                "duration": "medium"
-            },
-            "creative": {
-                "type": "cube",
-                "duration": "slow"
-            },
-            "minimal": {
-                "type": "fade",
-                "duration": "fast"
-            }
-        }
-        return presets.get(preset_name)
+        return _thaw_preset(_TRANSITION_PRESETS.get(preset_name))
 
 
 class AnimationPresets:
     """Predefined animation configurations."""
     
+    __slots__ = ()
+    
     @staticmethod
     def get_preset(preset_name: str) -> Optional[Dict[str, Any]]:
         """Get predefined animation configuration."""
-        presets = {
-            "slide_in": {
-                "type": "fly_in",
-                "duration": "medium",
-                "trigger": "on_click"
-            },
-            "fade_in": {
-                "type": "fade_in",
-                "duration": "medium",
-                "trigger": "on_click"
-            },
-            "zoom_in": {
-                "type": "zoom",
-                "duration": "fast",
-                "trigger": "on_click"
-            },
-            "bounce_in": {
-                "type": "bounce",
-                "duration": "medium",
-                "trigger": "on_click"
-            },
-            "spin_in": {
-                "type": "swivel",
-                "duration": "medium",
-                "trigger": "on_click"
-            },
-            "auto_fade": {
-                "type": "fade_in",
-                "duration": "medium",
-                "trigger": "after_previous",
-                "delay": 0.5
-            },
-            "sequence_fade": {
-                "type": "fade_in",
-                "duration": "fast",
-                "trigger": "after_previous",
-                "delay": 0.3
-            }
-        }
-        return presets.get(preset_name)
+        return _thaw_preset(_ANIMATION_PRESETS.get(preset_name))
     
     @staticmethod
     def get_sequence_preset(preset_name: str) -> Optional[Dict[str, Any]]:
         """Get predefined animation sequence configuration."""
-        presets = {
-            "cascade": {
-                "type": "sequential",
-                "base_delay": 0,
-                "delay_increment": 0.3,
-                "animation": {
-                    "type": "fade_in",
-                    "duration": "fast",
-                    "trigger": "after_previous"
-                }
-            },
-            "simultaneous": {
-                "type": "simultaneous",
-                "base_delay": 0,
-                "delay_increment": 0,
-                "animation": {
-                    "type": "zoom",
-                    "duration": "medium",
-                    "trigger": "on_click"
-                }
-            },
-            "wave": {
-                "type": "sequential",
-                "base_delay": 0,
-                "delay_increment": 0.2,
-                "animation": {
-                    "type": "fly_in",
-                    "duration": "fast",
-                    "trigger": "after_previous"
-                }
-            }
-        }
-        return presets.get(preset_name)
+        return _thaw_preset(_SEQUENCE_PRESETS.get(preset_name))
@@ -7,19 +7,51 @@ Usage (via Poetry):
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
-from typing import Any, Dict
+import re
+from typing import TYPE_CHECKING, Any, Dict
 
-from .engine import PPTXEngine
+if TYPE_CHECKING:
+    from .engine import PPTXEngine
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib parser is used when it isn't installed
+    orjson = None
+
+# A run of 19+ digits may be an integer orjson would silently turn into a float
+_LONG_DIGIT_RUN = re.compile(rb"\d{19}")
 
 
 def load_json(path: str) -> Dict[str, Any]:
+    if orjson is not None:
+        with open(path, "rb") as f:
+            data = f.read()
+        # orjson is only a fast path: anything it would reject (NaN, Infinity) or
+        # round (over-64-bit integers) is parsed by the stdlib, as without orjson
+        if not _LONG_DIGIT_RUN.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(data)
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def parse_args() -> argparse.Namespace:
+@functools.cache
+def _get_engine() -> PPTXEngine:
+    """Engine shared by every generation in this process."""
+    # Imported here so --help and --validate runs don't load the rendering stack up front
+    from .engine import PPTXEngine
+    
+    return PPTXEngine()
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Generate PPTX from JSON spec.")
     parser.add_argument(
         "--input",
@@ -49,7 +81,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip engine compatibility test during validation",
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    # The parser is built once per process; each call still gets a fresh Namespace
+    return _build_parser().parse_args()
 
 
 def main() -> None:
@@ -82,8 +119,7 @@ def main() -> None:
         base_dir = args.assets_base or os.path.dirname(os.path.abspath(args.input))
         
         # Create presentation using the engine
-        engine = PPTXEngine()
-        presentation = engine.create_presentation(config, base_dir)
+        presentation = _get_engine().create_presentation(config, base_dir)
         
         # Save presentation
         presentation.save(args.output)
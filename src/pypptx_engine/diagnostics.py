@@ -5,19 +5,138 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict, List
+import re
+from copy import deepcopy
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 from pathlib import Path
+from types import MappingProxyType
 
-from .engine import PPTXEngine
+try:
+    import orjson
+except ImportError:  # optional; the stdlib codec is used when it isn't installed
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; large configs are then loaded in full
+    ijson = None
+
+# A run of 19+ digits may be an integer orjson would silently turn into a float
+_LONG_DIGIT_RUN = re.compile(rb"\d{19}")
+
+# Configs above this size are validated slide by slide when ijson is available
+_STREAMING_THRESHOLD = 10 * 1024 * 1024
+
+# Position fields every shape should carry, in reporting order, with the defaults _fix_shape fills in
+_COORD_DEFAULTS = (("x", 1), ("y", 1), ("w", 4), ("h", 1))
+_COORD_KEYS = frozenset(coord for coord, _ in _COORD_DEFAULTS)
+
+# Defaults filled in by fix_common_issues; copied on insertion so fixed configs never share them
+_DEFAULT_PROPERTIES = {"title": "Generated Presentation", "author": "pypptx-engine"}
+_DEFAULT_SIZE = {"width_in": 16, "height_in": 9}
+_DEFAULT_LAYOUT = 6  # Blank layout
+_DEFAULT_CHART_TYPE = "COLUMN_CLUSTERED"
+_DEFAULT_CATEGORIES = ("A", "B", "C")
+_DEFAULT_SERIES = ({"name": "Data", "values": (1, 2, 3)},)
+
+# Longest list of issues or warnings spelled out in a report; the rest are summarised in one line
+_REPORT_ITEM_LIMIT = 50
+
+# Directories, relative to the working directory, where relative image paths are looked up
+_IMAGE_SEARCH_DIRS = (".", "src/examples", "assets")
+
+# Image paths the engine downloads instead of reading from disk
+_REMOTE_IMAGE_PREFIXES = ("http://", "https://")
+
+
+def _parse_json(path: str) -> Any:
+    """Parse a JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            data = f.read()
+        # orjson is only a fast path: anything it would reject (NaN, Infinity) or round
+        # (over-64-bit integers) is parsed by the stdlib, so validity never depends on it
+        if not _LONG_DIGIT_RUN.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(data)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=1)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file once per (path, mtime, size); callers must not mutate the result."""
+    return _parse_json(path)
+
+
+def _load_json(json_path: str) -> Any:
+    """Load a JSON file, reusing the parsed result while the file is unchanged on disk."""
+    path = os.path.abspath(json_path)
+    st = os.stat(path)
+    # Only the most recent file is kept, and large ones never, so no parsed config outlives its caller
+    if st.st_size > _STREAMING_THRESHOLD:
+        return _parse_json(path)
+    return _load_json_cached(path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=8)
+def _dir_index(directory: str) -> frozenset:
+    """Names of the entries in directory, read with a single scandir."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _shape_prefix(slide_index: int, shape_index: int) -> str:
+    """Location label for shape messages, built only when a message is actually reported."""
+    return f"Slide {slide_index + 1}, Shape {shape_index + 1}"
+
+
+def _report_items(items: List[str]) -> List[str]:
+    """Markdown bullet lines for items, capped at _REPORT_ITEM_LIMIT entries."""
+    lines = [f"- {item}\n" for item in items[:_REPORT_ITEM_LIMIT]]
+    hidden = len(items) - _REPORT_ITEM_LIMIT
+    if hidden > 0:
+        lines.append(f"- … and {hidden} more\n")
+    return lines
+
+
+def _dump_json(obj: Any, output_path: str) -> None:
+    """Write obj as 2-space indented JSON."""
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2)
 
 
 class PresentationDiagnostics:
     """Diagnostic tools to identify and fix presentation issues."""
     
     def __init__(self):
-        self.engine = PPTXEngine()
+        self._engine = None
         self.issues = []
     
+    @property
+    def engine(self):
+        """Engine instance, created on first use; diagnosing and fixing never need one."""
+        if self._engine is None:
+            from .engine import PPTXEngine
+            
+            self._engine = PPTXEngine()
+        return self._engine
+    
+    @engine.setter
+    def engine(self, engine):
+        self._engine = engine
+    
     def diagnose_json(self, json_path: str) -> Dict[str, Any]:
         """Diagnose issues in JSON configuration file."""
         results = {
@@ -28,9 +147,15 @@ class PresentationDiagnostics:
             "warnings": []
         }
         
+        # Directory listings are only reused within one diagnosis, so files added since are seen
+        _dir_index.cache_clear()
+        
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            if ijson is not None and os.path.getsize(json_path) > _STREAMING_THRESHOLD:
+                self._diagnose_streaming(json_path, results)
+                return results
+            
+            config = _load_json(json_path)
             results["valid_json"] = True
             
             # Check presentation structure
@@ -60,13 +185,40 @@ class PresentationDiagnostics:
         
         return results
     
+    def _diagnose_streaming(self, json_path: str, results: Dict[str, Any]) -> None:
+        """Diagnose a large file without loading it, keeping one slide in memory at a time."""
+        try:
+            with open(json_path, 'rb') as f:
+                # Cheap event scan for the structure keys, stopping as soon as 'slides' shows up
+                has_slides = False
+                for prefix, event, value in ijson.parse(f):
+                    if event != 'map_key':
+                        continue
+                    if prefix == '' and value == 'presentation':
+                        results["has_presentation"] = True
+                    elif prefix == 'presentation' and value == 'slides':
+                        has_slides = True
+                        break
+                
+                if has_slides:
+                    f.seek(0)
+                    for i, slide in enumerate(ijson.items(f, 'presentation.slides.item')):
+                        self._validate_slide(slide, i, results)
+                        results["slide_count"] = i + 1
+                elif results["has_presentation"]:
+                    results["issues"].append("No 'slides' array found in presentation")
+                else:
+                    results["issues"].append("No 'presentation' object found in JSON")
+            
+            results["valid_json"] = True
+        except ijson.JSONError as e:
+            results["issues"].append(f"Invalid JSON: {e}")
+    
     def _validate_slide(self, slide: Dict[str, Any], slide_index: int, results: Dict[str, Any]) -> None:
         """Validate individual slide configuration."""
-        slide_prefix = f"Slide {slide_index + 1}"
-        
         # Check layout
         if "layout" not in slide:
-            results["warnings"].append(f"{slide_prefix}: No layout specified, using default")
+            results["warnings"].append(f"Slide {slide_index + 1}: No layout specified, using default")
         
         # Check shapes
         if "shapes" in slide:
@@ -76,106 +228,109 @@ class PresentationDiagnostics:
     
     def _validate_shape(self, shape: Dict[str, Any], slide_index: int, shape_index: int, results: Dict[str, Any]) -> None:
         """Validate individual shape configuration."""
-        shape_prefix = f"Slide {slide_index + 1}, Shape {shape_index + 1}"
-        
         # Check required fields
         if "type" not in shape:
-            results["issues"].append(f"{shape_prefix}: Missing 'type' field")
+            results["issues"].append(f"{_shape_prefix(slide_index, shape_index)}: Missing 'type' field")
             return
         
         shape_type = shape["type"]
         
-        # Validate coordinates
-        for coord in ["x", "y", "w", "h"]:
-            if coord not in shape:
-                results["warnings"].append(f"{shape_prefix}: Missing '{coord}' coordinate, using default")
+        # Validate coordinates; the subset test skips the per-key loop when all are present
+        if not _COORD_KEYS <= shape.keys():
+            shape_prefix = _shape_prefix(slide_index, shape_index)
+            for coord, _ in _COORD_DEFAULTS:
+                if coord not in shape:
+                    results["warnings"].append(f"{shape_prefix}: Missing '{coord}' coordinate, using default")
         
-        # Type-specific validation
-        if shape_type == "chart":
-            self._validate_chart(shape, shape_prefix, results)
-        elif shape_type == "image":
-            self._validate_image(shape, shape_prefix, results)
-        elif shape_type == "autoshape":
-            self._validate_autoshape(shape, shape_prefix, results)
+        # Type-specific validation; non-string types (e.g. a list) simply have no validator
+        validator = self._SHAPE_VALIDATORS.get(shape_type) if isinstance(shape_type, str) else None
+        if validator is not None:
+            validator(self, shape, slide_index, shape_index, results)
     
-    def _validate_chart(self, shape: Dict[str, Any], prefix: str, results: Dict[str, Any]) -> None:
+    def _validate_chart(self, shape: Dict[str, Any], slide_index: int, shape_index: int, results: Dict[str, Any]) -> None:
         """Validate chart configuration."""
         if "chartType" not in shape:
-            results["warnings"].append(f"{prefix}: No chartType specified, using default")
+            results["warnings"].append(f"{_shape_prefix(slide_index, shape_index)}: No chartType specified, using default")
         
         if "series" not in shape or not shape["series"]:
-            results["issues"].append(f"{prefix}: Chart has no data series")
+            results["issues"].append(f"{_shape_prefix(slide_index, shape_index)}: Chart has no data series")
     
-    def _validate_image(self, shape: Dict[str, Any], prefix: str, results: Dict[str, Any]) -> None:
+    def _validate_image(self, shape: Dict[str, Any], slide_index: int, shape_index: int, results: Dict[str, Any]) -> None:
         """Validate image configuration."""
         if "path" not in shape:
-            results["issues"].append(f"{prefix}: Image has no 'path' specified")
+            results["issues"].append(f"{_shape_prefix(slide_index, shape_index)}: Image has no 'path' specified")
         else:
             # Check if file exists (relative to common locations)
             image_path = shape["path"]
-            if not os.path.isabs(image_path):
-                # Check common locations
-                possible_paths = [
-                    image_path,
-                    f"src/examples/{image_path}",
-                    f"assets/{image_path}"
-                ]
-                found = any(os.path.exists(p) for p in possible_paths)
+            if not os.path.isabs(image_path) and not image_path.startswith(_REMOTE_IMAGE_PREFIXES):
+                # Check common locations; bare file names are answered from one listing per directory
+                # and anything else (or a miss, e.g. on case-insensitive filesystems) is lstat'ed,
+                # stopping at the first hit
+                cwd = os.getcwd()
+                found = (
+                    not os.path.dirname(image_path)
+                    and any(image_path in _dir_index(os.path.join(cwd, d)) for d in _IMAGE_SEARCH_DIRS)
+                ) or any(os.path.lexists(os.path.join(d, image_path)) for d in _IMAGE_SEARCH_DIRS)
                 if not found:
-                    results["warnings"].append(f"{prefix}: Image file may not exist: {image_path}")
+                    results["warnings"].append(
+                        f"{_shape_prefix(slide_index, shape_index)}: Image file may not exist: {image_path}"
+                    )
     
-    def _validate_autoshape(self, shape: Dict[str, Any], prefix: str, results: Dict[str, Any]) -> None:
+    def _validate_autoshape(self, shape: Dict[str, Any], slide_index: int, shape_index: int, results: Dict[str, Any]) -> None:
         """Validate autoshape configuration."""
         if "shape_type" not in shape:
-            results["warnings"].append(f"{prefix}: No shape_type specified for autoshape")
+            results["warnings"].append(f"{_shape_prefix(slide_index, shape_index)}: No shape_type specified for autoshape")
+    
+    # Shape type -> type-specific validator, called as validator(self, shape, slide_index, shape_index, results)
+    _SHAPE_VALIDATORS = MappingProxyType({
+        "chart": _validate_chart,
+        "image": _validate_image,
+        "autoshape": _validate_autoshape
+    })
     
-    def generate_report(self, json_path: str) -> str:
+    def generate_report(self, json_path: str, results: Optional[Dict[str, Any]] = None) -> str:
         """Generate a comprehensive diagnostic report."""
-        results = self.diagnose_json(json_path)
-        
-        report = f"# Presentation Diagnostic Report\n\n"
-        report += f"**File**: {json_path}\n\n"
+        if results is None:
+            results = self.diagnose_json(json_path)
         
-        # Status
-        if results["valid_json"]:
-            report += "✅ **JSON Format**: Valid\n"
-        else:
-            report += "❌ **JSON Format**: Invalid\n"
-        
-        if results["has_presentation"]:
-            report += "✅ **Presentation Structure**: Valid\n"
-        else:
-            report += "❌ **Presentation Structure**: Missing\n"
+        issues = results["issues"]
+        warnings = results["warnings"]
         
-        report += f"📊 **Slide Count**: {results['slide_count']}\n\n"
+        parts = [
+            "# Presentation Diagnostic Report\n\n",
+            f"**File**: {json_path}\n\n",
+            # Status
+            "✅ **JSON Format**: Valid\n" if results["valid_json"] else "❌ **JSON Format**: Invalid\n",
+            "✅ **Presentation Structure**: Valid\n" if results["has_presentation"]
+            else "❌ **Presentation Structure**: Missing\n",
+            f"📊 **Slide Count**: {results['slide_count']}\n\n",
+        ]
         
         # Issues
-        if results["issues"]:
-            report += "## ❌ Critical Issues\n\n"
-            for issue in results["issues"]:
-                report += f"- {issue}\n"
-            report += "\n"
+        if issues:
+            parts.append("## ❌ Critical Issues\n\n")
+            parts.extend(_report_items(issues))
+            parts.append("\n")
         
         # Warnings
-        if results["warnings"]:
-            report += "## ⚠️ Warnings\n\n"
-            for warning in results["warnings"]:
-                report += f"- {warning}\n"
-            report += "\n"
+        if warnings:
+            parts.append("## ⚠️ Warnings\n\n")
+            parts.extend(_report_items(warnings))
+            parts.append("\n")
         
-        if not results["issues"] and not results["warnings"]:
-            report += "## ✅ All Good!\n\nNo issues or warnings found.\n\n"
+        if not issues and not warnings:
+            parts.append("## ✅ All Good!\n\nNo issues or warnings found.\n\n")
         
         # Recommendations
-        report += "## 🔧 Recommendations\n\n"
-        if results["issues"]:
-            report += "1. Fix critical issues before generating presentation\n"
-        if results["warnings"]:
-            report += "2. Review warnings for potential improvements\n"
-        report += "3. Test with simple configuration first\n"
-        report += "4. Use `poetry run pypptx-engine --input file.json --output test.pptx`\n"
+        parts.append("## 🔧 Recommendations\n\n")
+        if issues:
+            parts.append("1. Fix critical issues before generating presentation\n")
+        if warnings:
+            parts.append("2. Review warnings for potential improvements\n")
+        parts.append("3. Test with simple configuration first\n")
+        parts.append("4. Use `poetry run pypptx-engine --input file.json --output test.pptx`\n")
         
-        return report
+        return "".join(parts)
     
     def fix_common_issues(self, json_path: str, output_path: str = None) -> str:
         """Automatically fix common issues in JSON configuration."""
@@ -184,13 +339,12 @@ class PresentationDiagnostics:
             output_path = f"{base}_fixed.json"
         
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            # _apply_fixes edits in place, so work on a copy of the shared parsed config
+            config = deepcopy(_load_json(json_path))
             
             fixed_config = self._apply_fixes(config)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(fixed_config, f, indent=2)
+            _dump_json(fixed_config, output_path)
             
             return f"✅ Fixed configuration saved to: {output_path}"
             
@@ -205,51 +359,42 @@ class PresentationDiagnostics:
         
         pres = config["presentation"]
         
-        # Add default properties if missing
+        # Add default properties and size if missing
         if "properties" not in pres:
-            pres["properties"] = {
-                "title": "Generated Presentation",
-                "author": "pypptx-engine"
-            }
-        
-        # Add default size if missing
+            pres["properties"] = dict(_DEFAULT_PROPERTIES)
         if "size" not in pres:
-            pres["size"] = {"width_in": 16, "height_in": 9}
+            pres["size"] = dict(_DEFAULT_SIZE)
         
         # Fix slides
-        if "slides" in pres:
-            for slide in pres["slides"]:
-                self._fix_slide(slide)
+        for slide in pres.get("slides", ()):
+            self._fix_slide(slide)
         
         return config
     
     def _fix_slide(self, slide: Dict[str, Any]) -> None:
         """Fix common slide issues."""
         # Add default layout
-        if "layout" not in slide:
-            slide["layout"] = 6  # Blank layout
+        slide.setdefault("layout", _DEFAULT_LAYOUT)
         
         # Fix shapes
-        if "shapes" in slide:
-            for shape in slide["shapes"]:
-                self._fix_shape(shape)
+        for shape in slide.get("shapes", ()):
+            self._fix_shape(shape)
     
     def _fix_shape(self, shape: Dict[str, Any]) -> None:
         """Fix common shape issues."""
         # Add default coordinates
-        defaults = {"x": 1, "y": 1, "w": 4, "h": 1}
-        for coord, default in defaults.items():
-            if coord not in shape:
-                shape[coord] = default
+        for coord, default in _COORD_DEFAULTS:
+            shape.setdefault(coord, default)
         
         # Fix chart issues
         if shape.get("type") == "chart":
-            if "chartType" not in shape:
-                shape["chartType"] = "COLUMN_CLUSTERED"
+            shape.setdefault("chartType", _DEFAULT_CHART_TYPE)
             if "categories" not in shape:
-                shape["categories"] = ["A", "B", "C"]
-            if "series" not in shape or not shape["series"]:
-                shape["series"] = [{"name": "Data", "values": [1, 2, 3]}]
+                shape["categories"] = list(_DEFAULT_CATEGORIES)
+            if not shape.get("series"):
+                shape["series"] = [
+                    {"name": series["name"], "values": list(series["values"])} for series in _DEFAULT_SERIES
+                ]
 
 
 def main():
@@ -264,11 +409,11 @@ def main():
     diagnostics = PresentationDiagnostics()
     
     # Generate report
-    report = diagnostics.generate_report(json_file)
+    results = diagnostics.diagnose_json(json_file)
+    report = diagnostics.generate_report(json_file, results)
     print(report)
     
     # Offer to fix issues
-    results = diagnostics.diagnose_json(json_file)
     if results["issues"]:
         response = input("\nWould you like to generate a fixed version? (y/n): ")
         if response.lower() == 'y':
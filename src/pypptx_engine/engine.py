@@ -3,28 +3,60 @@ Core PPTX Engine - Main orchestrator for JSON to PPTX conversion
 """
 from __future__ import annotations
 
+import io
+import logging
 import os
+from functools import lru_cache
 from typing import Any, Dict
 
 from pptx import Presentation
-from pptx.util import Inches
 
 from .formatters import ColorFormatter
 from .shapes import ShapeFactory
 from .slides import SlideManager
 from .templates import TemplateManager
-from .animations import AnimationManager
+from .animations import ANIMATION_MANAGER
+
+logger = logging.getLogger(__name__)
+
+# "properties" keys copied verbatim onto prs.core_properties, in a fixed order so output is stable
+_CORE_PROPERTY_KEYS = ("title", "author", "subject", "comments", "category", "keywords")
+
+# English Metric Units, the integer unit slide dimensions are stored in
+_EMU_PER_INCH = 914400
+_EMU_PER_CM = 360000
+
+
+@lru_cache(maxsize=1)
+def _default_template_bytes() -> bytes:
+    """The default python-pptx template, read and serialized once per process."""
+    buffer = io.BytesIO()
+    Presentation().save(buffer)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=1)
+def _shared_color_formatter() -> ColorFormatter:
+    """Process-wide ColorFormatter; it holds no state."""
+    return ColorFormatter()
+
+
+@lru_cache(maxsize=1)
+def _shared_slide_manager() -> SlideManager:
+    """Process-wide SlideManager; it holds nothing beyond the shared color formatter."""
+    return SlideManager(_shared_color_formatter())
 
 
 class PPTXEngine:
     """Main engine for converting JSON specifications to PPTX presentations."""
     
     def __init__(self):
-        self.color_formatter = ColorFormatter()
+        self.color_formatter = _shared_color_formatter()
+        self.slide_manager = _shared_slide_manager()
+        self.animation_manager = ANIMATION_MANAGER
+        # Per engine: the flowchart handler keeps per-call state and templates are public, mutable dicts
         self.shape_factory = ShapeFactory(self.color_formatter)
-        self.slide_manager = SlideManager(self.color_formatter)
         self.template_manager = TemplateManager()
-        self.animation_manager = AnimationManager()
     
     def create_presentation(self, config: Dict[str, Any], base_dir: str = "") -> Presentation:
         """Create a PowerPoint presentation from JSON configuration."""
@@ -38,8 +70,11 @@ class PPTXEngine:
             config = self.template_manager.apply_template_to_config(config, template_name, theme_name)
             pres_config = config.get("presentation", {})
         
-        # Create presentation
-        prs = Presentation()
+        # Image files may have changed since the last render
+        self.shape_factory.image_handler.clear_path_cache()
+        
+        # Create presentation from the in-memory copy of the default template
+        prs = Presentation(io.BytesIO(_default_template_bytes()))
         
         # Set presentation properties
         self._apply_presentation_properties(prs, pres_config)
@@ -69,30 +104,23 @@ class PPTXEngine:
     def _apply_presentation_properties(self, prs: Presentation, config: Dict[str, Any]) -> None:
         """Apply presentation-level properties like title, author, etc."""
         properties = config.get("properties", {})
-        core_props = prs.core_properties
+        if not properties:
+            return
         
-        if "title" in properties:
-            core_props.title = properties["title"]
-        if "author" in properties:
-            core_props.author = properties["author"]
-        if "subject" in properties:
-            core_props.subject = properties["subject"]
-        if "comments" in properties:
-            core_props.comments = properties["comments"]
-        if "category" in properties:
-            core_props.category = properties["category"]
-        if "keywords" in properties:
-            core_props.keywords = properties["keywords"]
+        core_props = prs.core_properties
+        for key in _CORE_PROPERTY_KEYS:
+            if key in properties:
+                setattr(core_props, key, properties[key])
     
     def _apply_slide_size(self, prs: Presentation, size_config: Dict[str, Any]) -> None:
         """Apply custom slide dimensions."""
         if "width_in" in size_config and "height_in" in size_config:
-            prs.slide_width = Inches(size_config["width_in"])
-            prs.slide_height = Inches(size_config["height_in"])
+            prs.slide_width = int(size_config["width_in"] * _EMU_PER_INCH)
+            prs.slide_height = int(size_config["height_in"] * _EMU_PER_INCH)
         elif "width_cm" in size_config and "height_cm" in size_config:
-            # Convert cm to inches (1 inch = 2.54 cm)
-            prs.slide_width = Inches(size_config["width_cm"] / 2.54)
-            prs.slide_height = Inches(size_config["height_cm"] / 2.54)
+            # Exact EMU-per-cm factor, no round trip through inches
+            prs.slide_width = int(size_config["width_cm"] * _EMU_PER_CM)
+            prs.slide_height = int(size_config["height_cm"] * _EMU_PER_CM)
     
     def generate_presentation(self, config: Dict[str, Any], output_path: str, base_dir: str = "") -> None:
         """Generate and save a PowerPoint presentation from JSON configuration."""
@@ -100,13 +128,16 @@ class PPTXEngine:
             # Create presentation
             prs = self.create_presentation(config, base_dir)
             
-            # Ensure output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            # Ensure output directory exists; a bare filename has no directory to create
+            output_dir = os.path.dirname(output_path)
+            if output_dir and not os.path.isdir(output_dir):
+                os.makedirs(output_dir, exist_ok=True)
             
             # Save presentation
             prs.save(output_path)
-            print(f"✅ Presentation saved to: {output_path}")
+            logger.info("Presentation saved to: %s", output_path)
             
-        except Exception as e:
-            print(f"❌ Error generating presentation: {e}")
+        except (OSError, LookupError, ValueError) as e:
+            # Expected failures (bad paths, bad layout indices or values) are logged before propagating
+            logger.error("Error generating presentation: %s", e)
             raise
@@ -3,13 +3,64 @@ Flowchart creation and management for pypptx-engine
 """
 from __future__ import annotations
 
+import logging
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Dict, List, Tuple
-from pptx.util import Inches, Pt
+from pptx.util import Inches
 from pptx.enum.shapes import MSO_SHAPE, MSO_CONNECTOR_TYPE
 from pptx.enum.text import MSO_VERTICAL_ANCHOR, PP_PARAGRAPH_ALIGNMENT
 
 from .formatters import FontFormatter, ColorFormatter, LineFormatter, ShadowFormatter
 
+logger = logging.getLogger(__name__)
+
+# Element positions and sizes repeat heavily within a flowchart; Length values are immutable
+_inches = lru_cache(maxsize=256)(Inches)
+
+# Connector kinds add_connector can draw; anything else (e.g. "CURVED" or "MIXED") falls back to STRAIGHT
+_CONNECTOR_TYPES = {
+    "STRAIGHT": MSO_CONNECTOR_TYPE.STRAIGHT,
+    "ELBOW": MSO_CONNECTOR_TYPE.ELBOW,
+    "CURVE": MSO_CONNECTOR_TYPE.CURVE
+}
+
+
+def _with_parsed_color(style: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a style dict whose "color" is already an RGBColor, so applying it skips hex parsing."""
+    if "color" not in style:
+        return style
+    return {**style, "color": ColorFormatter.parse_color(style["color"])}
+
+
+def _build_style_table(styles: Dict[str, Dict[str, Any]]) -> Dict[str, Tuple[Dict[str, Any], ...]]:
+    """Flatten styles to element type -> (fill, line, font), with their hex colors parsed up front."""
+    return {
+        element_type: (
+            _with_parsed_color(style.get("fill", {})),
+            _with_parsed_color(style.get("line", {})),
+            _with_parsed_color(style.get("font", {}))
+        )
+        for element_type, style in styles.items()
+    }
+
+
+def _center_point(left: int, top: int, width: int, height: int) -> Tuple[int, int]:
+    return (left + width // 2, top + height // 2)
+
+
+# Side name -> (left, top, width, height) -> connection point, all in EMU; unknown sides use the center
+_CONNECTION_POINTS = {
+    "top": lambda left, top, width, height: (left + width // 2, top),
+    "bottom": lambda left, top, width, height: (left + width // 2, top + height),
+    "left": lambda left, top, width, height: (left, top + height // 2),
+    "right": lambda left, top, width, height: (left + width, top + height // 2),
+    "top-left": lambda left, top, width, height: (left, top),
+    "top-right": lambda left, top, width, height: (left + width, top),
+    "bottom-left": lambda left, top, width, height: (left, top + height),
+    "bottom-right": lambda left, top, width, height: (left + width, top + height)
+}
+
 
 class FlowchartHandler:
     """Handle flowchart creation with predefined shapes and automatic connections."""
@@ -87,23 +138,30 @@ class FlowchartHandler:
     def __init__(self, color_formatter):
         self.color_formatter = color_formatter
         self.created_shapes = {}  # Store created shapes for connection references
+        self._point_cache = {}  # (id(shape), side) -> connection point, valid for one flowchart build
+        self._style_table = _build_style_table(self.DEFAULT_STYLES)
     
     def create_flowchart(self, slide, config: Dict[str, Any], x, y, w, h) -> None:
         """Create a complete flowchart from configuration."""
         # Clear previous shapes reference for new flowchart
         self.created_shapes = {}
+        self._point_cache = {}
+        # Rebuilt per flowchart so changes to DEFAULT_STYLES made between builds are honoured
+        self._style_table = _build_style_table(self.DEFAULT_STYLES)
         
         # Get flowchart elements
         elements = config.get("elements", [])
         connections = config.get("connections", [])
         
-        # Create all flowchart elements first
+        # Create all flowchart elements first; the bound methods are looked up once, not per item
+        create_element = self._create_flowchart_element
         for element in elements:
-            self._create_flowchart_element(slide, element)
+            create_element(slide, element)
         
         # Then create connections between elements
+        create_connection = self._create_connection
         for connection in connections:
-            self._create_connection(slide, connection)
+            create_connection(slide, connection)
     
     def _create_flowchart_element(self, slide, element_config: Dict[str, Any]) -> None:
         """Create a single flowchart element."""
@@ -112,10 +170,10 @@ class FlowchartHandler:
         text = element_config.get("text", "")
         
         # Get position and size
-        x = Inches(element_config.get("x", 0))
-        y = Inches(element_config.get("y", 0))
-        w = Inches(element_config.get("w", 2))
-        h = Inches(element_config.get("h", 1))
+        x = _inches(element_config.get("x", 0))
+        y = _inches(element_config.get("y", 0))
+        w = _inches(element_config.get("w", 2))
+        h = _inches(element_config.get("h", 1))
         
         # Get the appropriate shape type
         shape_type = self.FLOWCHART_SHAPES.get(element_type, MSO_SHAPE.RECTANGLE)
@@ -128,40 +186,45 @@ class FlowchartHandler:
             self.created_shapes[element_id] = shape
         
         # Add text if specified
+        paragraphs = ()
         if text and shape.has_text_frame:
             shape.text = text
             text_frame = shape.text_frame
             text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
             text_frame.word_wrap = True
             
-            # Center align text
-            for paragraph in text_frame.paragraphs:
+            # Center align text; newlines in the text make several paragraphs
+            paragraphs = text_frame.paragraphs
+            for paragraph in paragraphs:
                 paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
         
-        # Apply styling
-        self._apply_flowchart_styling(shape, element_type, element_config)
+        # Apply styling, reusing the paragraphs read above instead of walking the text frame again
+        self._apply_flowchart_styling(shape, element_type, element_config, paragraphs)
     
-    def _apply_flowchart_styling(self, shape, element_type: str, config: Dict[str, Any]) -> None:
-        """Apply styling to a flowchart element."""
+    def _apply_flowchart_styling(self, shape, element_type: str, config: Dict[str, Any],
+                                 paragraphs: Tuple[Any, ...] = ()) -> None:
+        """Apply styling to a flowchart element whose text, if any, is in paragraphs."""
         # Get default style for element type
-        default_style = self.DEFAULT_STYLES.get(element_type, self.DEFAULT_STYLES["default"])
+        style_table = self._style_table
+        default_fill, default_line, default_font = style_table.get(element_type, style_table["default"])
         
         # Apply fill formatting
-        fill_config = config.get("fill", default_style.get("fill", {}))
+        fill_config = config.get("fill", default_fill)
         if fill_config:
             ColorFormatter.apply_fill(shape, fill_config)
         
         # Apply line formatting
-        line_config = config.get("line", default_style.get("line", {}))
+        line_config = config.get("line", default_line)
         if line_config:
             LineFormatter.apply_line_formatting(shape.line, line_config)
         
         # Apply font formatting to text
-        font_config = config.get("font", default_style.get("font", {}))
-        if font_config and shape.has_text_frame:
-            for paragraph in shape.text_frame.paragraphs:
+        font_config = config.get("font", default_font)
+        if font_config:
+            font = FontFormatter.resolve_font(font_config)
+            for paragraph in paragraphs:
                 for run in paragraph.runs:
-                    FontFormatter.apply_font_formatting(run.font, font_config)
+                    FontFormatter.apply_resolved_font(run.font, font)
         
         # Apply shadow if specified
         shadow_config = config.get("shadow")
@@ -174,14 +237,14 @@ class FlowchartHandler:
         to_id = connection_config.get("to")
         
         if not from_id or not to_id:
-            print(f"[WARN] Connection missing from/to IDs: {connection_config}")
+            logger.warning("Connection missing from/to IDs: %s", connection_config)
             return
         
         from_shape = self.created_shapes.get(from_id)
         to_shape = self.created_shapes.get(to_id)
         
         if not from_shape or not to_shape:
-            print(f"[WARN] Could not find shapes for connection: {from_id} -> {to_id}")
+            logger.warning("Could not find shapes for connection: %s -> %s", from_id, to_id)
             return
         
         # Calculate connection points
@@ -190,7 +253,7 @@ class FlowchartHandler:
         
         # Get connector type
         connector_type_name = connection_config.get("connector_type", "STRAIGHT")
-        connector_type = getattr(MSO_CONNECTOR_TYPE, connector_type_name, MSO_CONNECTOR_TYPE.STRAIGHT)
+        connector_type = _CONNECTOR_TYPES.get(connector_type_name, MSO_CONNECTOR_TYPE.STRAIGHT)
         
         # Create connector
         connector = slide.shapes.add_connector(
@@ -208,35 +271,15 @@ class FlowchartHandler:
         if label_text:
             self._add_connection_label(slide, connector, label_text, connection_config.get("label_config", {}))
     
-    def _get_connection_point(self, shape, side: str) -> Tuple[Any, Any]:
-        """Get connection point coordinates for a shape side."""
-        # Convert Inches objects to raw coordinate values and back to Inches
-        from pptx.util import Inches
-        
-        left = Inches(float(shape.left.inches))
-        top = Inches(float(shape.top.inches))
-        width = Inches(float(shape.width.inches))
-        height = Inches(float(shape.height.inches))
-        
-        if side == "top":
-            return (Inches(left.inches + width.inches / 2), top)
-        elif side == "bottom":
-            return (Inches(left.inches + width.inches / 2), Inches(top.inches + height.inches))
-        elif side == "left":
-            return (left, Inches(top.inches + height.inches / 2))
-        elif side == "right":
-            return (Inches(left.inches + width.inches), Inches(top.inches + height.inches / 2))
-        elif side == "top-left":
-            return (left, top)
-        elif side == "top-right":
-            return (Inches(left.inches + width.inches), top)
-        elif side == "bottom-left":
-            return (left, Inches(top.inches + height.inches))
-        elif side == "bottom-right":
-            return (Inches(left.inches + width.inches), Inches(top.inches + height.inches))
-        else:
-            # Default to center
-            return (Inches(left.inches + width.inches / 2), Inches(top.inches + height.inches / 2))
+    def _get_connection_point(self, shape, side: str) -> Tuple[int, int]:
+        """Get connection point coordinates (EMU) for a shape side."""
+        # Shapes don't move during a build and stay referenced by created_shapes, so id() is stable
+        key = (id(shape), side)
+        point = self._point_cache.get(key)
+        if point is None:
+            point = _CONNECTION_POINTS.get(side, _center_point)(shape.left, shape.top, shape.width, shape.height)
+            self._point_cache[key] = point
+        return point
     
     def _add_connection_label(self, slide, connector, label_text: str, label_config: Dict[str, Any]) -> None:
         """Add a text label to a connection."""
@@ -250,8 +293,8 @@ class FlowchartHandler:
         mid_y = (begin_y + end_y) / 2
         
         # Create text box for label
-        label_w = Inches(label_config.get("w", 1))
-        label_h = Inches(label_config.get("h", 0.3))
+        label_w = _inches(label_config.get("w", 1))
+        label_h = _inches(label_config.get("h", 0.3))
         
         # Adjust position to center the label
         label_x = mid_x - label_w / 2
@@ -264,12 +307,12 @@ class FlowchartHandler:
         
         # Apply label formatting
         default_font = {"size": 10, "color": "#2c3e50", "bold": True}
-        font_config = label_config.get("font", default_font)
+        font = FontFormatter.resolve_font(label_config.get("font", default_font))
         
         for paragraph in text_frame.paragraphs:
             paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
             for run in paragraph.runs:
-                FontFormatter.apply_font_formatting(run.font, font_config)
+                FontFormatter.apply_resolved_font(run.font, font)
         
         # Add background if specified
         if label_config.get("background"):
@@ -290,15 +333,14 @@ class FlowchartLayoutManager:
         positioned_elements = []
         current_y = start_y
         
-        for i, element in enumerate(elements):
-            positioned_element = element.copy()
-            positioned_element.update({
+        for element in elements:
+            positioned_elements.append({
+                **element,
                 "x": start_x,
                 "y": current_y,
                 "w": element_width,
                 "h": element_height
             })
-            positioned_elements.append(positioned_element)
             current_y += element_height + spacing_y
         
         return positioned_elements
@@ -310,15 +352,14 @@ class FlowchartLayoutManager:
         positioned_elements = []
         current_x = start_x
         
-        for i, element in enumerate(elements):
-            positioned_element = element.copy()
-            positioned_element.update({
+        for element in elements:
+            positioned_elements.append({
+                **element,
                 "x": current_x,
                 "y": start_y,
                 "w": element_width,
                 "h": element_height
             })
-            positioned_elements.append(positioned_element)
             current_x += element_width + spacing_x
         
         return positioned_elements
@@ -334,47 +375,44 @@ class FlowchartLayoutManager:
             return positioned_elements
         
         # Position root element
-        root = elements[0].copy()
-        root.update({
+        positioned_elements.append({
+            **elements[0],
             "x": start_x,
             "y": start_y,
             "w": 2.5,
             "h": 1
         })
-        positioned_elements.append(root)
         
         # Position remaining elements in branches
         current_y = start_y + level_spacing_y
         branch_positions = [start_x - branch_spacing_x, start_x + branch_spacing_x]
         
-        for i, element in enumerate(elements[1:], 1):
-            positioned_element = element.copy()
-            branch_index = (i - 1) % 2
-            positioned_element.update({
+        # Branches alternate left/right, filling one row per pair
+        for i, element in enumerate(islice(elements, 1, None)):
+            row, branch_index = divmod(i, 2)
+            positioned_elements.append({
+                **element,
                 "x": branch_positions[branch_index],
-                "y": current_y + ((i - 1) // 2) * level_spacing_y,
+                "y": current_y + row * level_spacing_y,
                 "w": 2.5,
                 "h": 1
             })
-            positioned_elements.append(positioned_element)
         
         return positioned_elements
     
     @staticmethod
     def auto_connect_sequential(element_ids: List[str], connector_type: str = "STRAIGHT") -> List[Dict[str, Any]]:
         """Create sequential connections between elements."""
-        connections = []
-        
-        for i in range(len(element_ids) - 1):
-            connections.append({
-                "from": element_ids[i],
-                "to": element_ids[i + 1],
+        return [
+            {
+                "from": from_id,
+                "to": to_id,
                 "connector_type": connector_type,
                 "from_side": "bottom",
                 "to_side": "top"
-            })
-        
-        return connections
+            }
+            for from_id, to_id in zip(element_ids, islice(element_ids, 1, None))
+        ]
     
     @staticmethod
     def auto_connect_decision_tree(root_id: str, branch_ids: List[str], 
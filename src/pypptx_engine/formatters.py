@@ -3,51 +3,86 @@ Formatting utilities for colors, fonts, fills, and other visual properties
 """
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 
 from pptx.dml.color import RGBColor
-from pptx.enum.dml import MSO_COLOR_TYPE, MSO_THEME_COLOR, MSO_FILL_TYPE, MSO_PATTERN_TYPE, MSO_LINE_DASH_STYLE
-from pptx.enum.text import MSO_VERTICAL_ANCHOR, PP_PARAGRAPH_ALIGNMENT, MSO_TEXT_UNDERLINE_TYPE
+from pptx.enum.dml import MSO_THEME_COLOR, MSO_PATTERN_TYPE, MSO_LINE_DASH_STYLE
+from pptx.enum.text import PP_PARAGRAPH_ALIGNMENT, MSO_TEXT_UNDERLINE_TYPE
 from pptx.util import Pt, Inches
 
 
+# Length values are immutable ints, so the common sizes and widths are built once and shared
+_pt = lru_cache(maxsize=512)(Pt)
+_inches = lru_cache(maxsize=512)(Inches)
+
+# Two-digit hex string (any mix of case) -> byte value, so parsing a color is three dict lookups
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+_HEX_PAIRS = {high + low: int(high + low, 16) for high in _HEX_DIGITS for low in _HEX_DIGITS}
+
+# Enum member name -> member; read-only views, so a lookup is one probe and never hits non-member attributes
+_PATTERN_TYPES = MSO_PATTERN_TYPE.__members__
+_UNDERLINE_TYPES = MSO_TEXT_UNDERLINE_TYPE.__members__
+_THEME_COLORS = MSO_THEME_COLOR.__members__
+_DASH_STYLES = MSO_LINE_DASH_STYLE.__members__
+
+
+@lru_cache(maxsize=512)
+def _hex_to_rgb_cached(hex_color: str) -> RGBColor:
+    """Parse a hex color string; RGBColor is an immutable tuple, so results are shared."""
+    if not hex_color:
+        return RGBColor(0, 0, 0)
+    
+    # Usual "#rrggbb" form: slice directly instead of building stripped copies
+    if len(hex_color) == 7 and hex_color[0] == "#":
+        try:
+            return RGBColor(_HEX_PAIRS[hex_color[1:3]], _HEX_PAIRS[hex_color[3:5]], _HEX_PAIRS[hex_color[5:7]])
+        except KeyError:
+            pass
+    
+    hex_color = hex_color.strip().lstrip("#")
+    if len(hex_color) != 6:
+        return RGBColor(0, 0, 0)
+    
+    try:
+        return RGBColor(_HEX_PAIRS[hex_color[0:2]], _HEX_PAIRS[hex_color[2:4]], _HEX_PAIRS[hex_color[4:6]])
+    except KeyError:
+        return RGBColor(0, 0, 0)
+
+
+@lru_cache(maxsize=512, typed=True)
+def _rgb_color_cached(r: int, g: int, b: int) -> RGBColor:
+    return RGBColor(r, g, b)
+
+
 class ColorFormatter:
     """Handle color conversions and formatting."""
     
     @staticmethod
-    def parse_color(color_spec: Union[str, Dict[str, Any], None]) -> Optional[RGBColor]:
+    def parse_color(color_spec: Union[str, Dict[str, Any], RGBColor, None]) -> Optional[RGBColor]:
         """Parse various color specifications into RGBColor."""
         if not color_spec:
             return None
         
+        # Hex strings go straight to the memoized parser; repeated brand colors are a cache hit
         if isinstance(color_spec, str):
-            return ColorFormatter._hex_to_rgb(color_spec)
+            return _hex_to_rgb_cached(color_spec)
         elif isinstance(color_spec, dict):
             if "hex" in color_spec:
-                return ColorFormatter._hex_to_rgb(color_spec["hex"])
+                return _hex_to_rgb_cached(color_spec["hex"])
             elif "rgb" in color_spec:
                 rgb = color_spec["rgb"]
-                return RGBColor(rgb[0], rgb[1], rgb[2])
+                return _rgb_color_cached(rgb[0], rgb[1], rgb[2])
+        elif isinstance(color_spec, RGBColor):
+            # Already parsed, e.g. built-in default styles
+            return color_spec
         
         return None
     
     @staticmethod
     def _hex_to_rgb(hex_color: str) -> RGBColor:
         """Convert hex color string to RGBColor."""
-        if not hex_color:
-            return RGBColor(0, 0, 0)
-        
-        hex_color = hex_color.strip().lstrip("#")
-        if len(hex_color) != 6:
-            return RGBColor(0, 0, 0)
-        
-        try:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            return RGBColor(r, g, b)
-        except ValueError:
-            return RGBColor(0, 0, 0)
+        return _hex_to_rgb_cached(hex_color)
     
     @staticmethod
     def apply_fill(shape, fill_config: Dict[str, Any]) -> None:
@@ -55,157 +90,241 @@ class ColorFormatter:
         if not fill_config:
             return
         
-        fill = shape.fill
-        fill_type = fill_config.get("type", "solid")
-        
-        if fill_type == "solid":
-            fill.solid()
-            color = ColorFormatter.parse_color(fill_config.get("color"))
-            if color:
-                fill.fore_color.rgb = color
-        elif fill_type == "gradient":
-            # Basic gradient support
-            fill.gradient()
-            gradient_stops = fill_config.get("stops", [])
-            for stop in gradient_stops:
-                color = ColorFormatter.parse_color(stop.get("color"))
-                if color:
-                    # Note: python-pptx gradient API is limited
-                    pass
-        elif fill_type == "pattern":
-            fill.patterned()
-            pattern_type = fill_config.get("pattern_type", "PERCENT_5")
-            if hasattr(MSO_PATTERN_TYPE, pattern_type):
-                fill.pattern_type = getattr(MSO_PATTERN_TYPE, pattern_type)
-            
-            # Set pattern colors
-            fore_color = ColorFormatter.parse_color(fill_config.get("fore_color"))
-            back_color = ColorFormatter.parse_color(fill_config.get("back_color"))
-            if fore_color:
-                fill.fore_color.rgb = fore_color
-            if back_color:
-                fill.back_color.rgb = back_color
-        elif fill_type == "picture":
-            # Picture fill would need image path
+        fill_handler = _FILL_HANDLERS.get(fill_config.get("type", "solid"))
+        if fill_handler is not None:
+            fill_handler(shape.fill, fill_config)
+
+
+def _apply_solid_fill(fill, fill_config: Dict[str, Any]) -> None:
+    fill.solid()
+    color = ColorFormatter.parse_color(fill_config.get("color"))
+    if color:
+        fill.fore_color.rgb = color
+
+
+def _apply_gradient_fill(fill, fill_config: Dict[str, Any]) -> None:
+    # Basic gradient support
+    fill.gradient()
+    gradient_stops = fill_config.get("stops", [])
+    for stop in gradient_stops:
+        color = ColorFormatter.parse_color(stop.get("color"))
+        if color:
+            # Note: python-pptx gradient API is limited
             pass
-        elif fill_type == "none":
-            fill.background()
+
+
+def _apply_pattern_fill(fill, fill_config: Dict[str, Any]) -> None:
+    fill.patterned()
+    pattern_type = _PATTERN_TYPES.get(fill_config.get("pattern_type", "PERCENT_5"))
+    if pattern_type is not None:
+        fill.pattern_type = pattern_type
+    
+    # Set pattern colors
+    fore_color = ColorFormatter.parse_color(fill_config.get("fore_color"))
+    back_color = ColorFormatter.parse_color(fill_config.get("back_color"))
+    if fore_color:
+        fill.fore_color.rgb = fore_color
+    if back_color:
+        fill.back_color.rgb = back_color
+
+
+def _apply_picture_fill(fill, fill_config: Dict[str, Any]) -> None:
+    # Picture fill would need image path
+    pass
+
+
+def _apply_no_fill(fill, fill_config: Dict[str, Any]) -> None:
+    fill.background()
+
+
+# Fill "type" -> handler(fill, fill_config); unknown types leave the fill untouched
+_FILL_HANDLERS = {
+    "solid": _apply_solid_fill,
+    "gradient": _apply_gradient_fill,
+    "pattern": _apply_pattern_fill,
+    "picture": _apply_picture_fill,
+    "none": _apply_no_fill
+}
+
+# Paragraph "alignment" values (lower-cased) -> python-pptx alignment
+_PARAGRAPH_ALIGNMENTS = {
+    "left": PP_PARAGRAPH_ALIGNMENT.LEFT,
+    "center": PP_PARAGRAPH_ALIGNMENT.CENTER,
+    "right": PP_PARAGRAPH_ALIGNMENT.RIGHT,
+    "justify": PP_PARAGRAPH_ALIGNMENT.JUSTIFY,
+    "distribute": PP_PARAGRAPH_ALIGNMENT.DISTRIBUTE
+}
 
 
 class FontFormatter:
     """Handle font formatting and text properties."""
     
     @staticmethod
-    def apply_font_formatting(font, font_config: Dict[str, Any]) -> None:
+    def apply_font_formatting(font, font_config: Optional[Dict[str, Any]]) -> None:
         """Apply font formatting from configuration with enhanced options."""
         if not font_config:
             return
         
-        if "name" in font_config:
-            font.name = font_config["name"]
-        
-        if "size" in font_config:
-            font.size = Pt(font_config["size"])
-        
-        if "bold" in font_config:
-            font.bold = bool(font_config["bold"])
-        
-        if "italic" in font_config:
-            font.italic = bool(font_config["italic"])
-        
-        if "underline" in font_config:
-            underline_type = font_config["underline"]
-            if isinstance(underline_type, bool):
-                font.underline = underline_type
-            elif isinstance(underline_type, str):
-                underline_type = underline_type.upper()
-                if hasattr(MSO_TEXT_UNDERLINE_TYPE, underline_type):
-                    font.underline = getattr(MSO_TEXT_UNDERLINE_TYPE, underline_type)
+        FontFormatter.apply_resolved_font(font, FontFormatter.resolve_font(font_config))
+    
+    @staticmethod
+    def resolve_font(font_config: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, Any], ...]:
+        """Resolve a font config once into (attribute, value) pairs, e.g. before styling many runs."""
+        if not font_config:
+            return ()
         
-        # Enhanced color support
-        if "color" in font_config:
-            color_spec = font_config["color"]
-            if isinstance(color_spec, dict):
-                # Advanced color with theme support
-                if "theme" in color_spec:
-                    theme_color = color_spec["theme"].upper()
-                    if hasattr(MSO_THEME_COLOR, theme_color):
-                        font.color.theme_color = getattr(MSO_THEME_COLOR, theme_color)
-                elif "rgb" in color_spec or "hex" in color_spec:
-                    color = ColorFormatter.parse_color(color_spec)
-                    if color:
-                        font.color.rgb = color
+        # Resolved in the table's fixed order, not the config's, so precedence (e.g. subscript over
+        # superscript) never depends on key order; keys without a resolver (e.g. strikethrough) are ignored
+        resolved = []
+        for key, resolver in _FONT_RESOLVERS.items():
+            if key in font_config:
+                attribute = resolver(font_config[key])
+                if attribute is not None:
+                    resolved.append(attribute)
+        return tuple(resolved)
+    
+    @staticmethod
+    def apply_resolved_font(font, resolved_font: Tuple[Tuple[str, Any], ...]) -> None:
+        """Apply pairs from resolve_font to a font."""
+        for attribute, value in resolved_font:
+            if attribute in _FONT_COLOR_ATTRIBUTES:
+                setattr(font.color, attribute, value)
             else:
-                # Simple color string
-                color = ColorFormatter.parse_color(color_spec)
-                if color:
-                    font.color.rgb = color
-        
-        # Additional font properties
-        if "strikethrough" in font_config:
-            # Note: python-pptx doesn't directly support strikethrough
-            pass
-        
-        if "superscript" in font_config:
-            if font_config["superscript"]:
-                font.superscript = True
-        
-        if "subscript" in font_config:
-            if font_config["subscript"]:
-                font.subscript = True
+                setattr(font, attribute, value)
     
     @staticmethod
-    def apply_paragraph_formatting(paragraph, para_config: Dict[str, Any]) -> None:
+    def apply_paragraph_formatting(paragraph, para_config: Optional[Dict[str, Any]]) -> None:
         """Apply paragraph-level formatting with enhanced options."""
         if not para_config:
             return
         
-        # Text alignment
-        alignment = para_config.get("alignment", "").lower()
-        if alignment == "left":
-            paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
-        elif alignment == "center":
-            paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
-        elif alignment == "right":
-            paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.RIGHT
-        elif alignment == "justify":
-            paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.JUSTIFY
-        elif alignment == "distribute":
-            paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.DISTRIBUTE
-        
-        # Spacing controls
-        if "space_before" in para_config:
-            paragraph.space_before = Pt(para_config["space_before"])
-        
-        if "space_after" in para_config:
-            paragraph.space_after = Pt(para_config["space_after"])
-        
-        if "line_spacing" in para_config:
-            line_spacing = para_config["line_spacing"]
-            if isinstance(line_spacing, (int, float)):
-                paragraph.line_spacing = line_spacing
-            elif isinstance(line_spacing, dict):
-                # Advanced line spacing with units
-                spacing_value = line_spacing.get("value", 1.0)
-                spacing_unit = line_spacing.get("unit", "multiple")  # "multiple", "points", "lines"
-                if spacing_unit == "multiple":
-                    paragraph.line_spacing = spacing_value
-                elif spacing_unit == "points":
-                    paragraph.line_spacing = Pt(spacing_value)
-        
-        # Indentation
-        if "left_indent" in para_config:
-            paragraph.left_indent = Inches(para_config["left_indent"])
-        
-        if "right_indent" in para_config:
-            paragraph.right_indent = Inches(para_config["right_indent"])
-        
-        if "first_line_indent" in para_config:
-            paragraph.first_line_indent = Inches(para_config["first_line_indent"])
-        
-        # Bullet/numbering level
-        if "level" in para_config:
-            paragraph.level = para_config["level"]
+        # One pass over the keys actually present, as for fonts
+        for key, value in para_config.items():
+            setter = _PARAGRAPH_SETTERS.get(key)
+            if setter is not None:
+                setter(paragraph, value)
+
+
+def _resolve_font_name(name):
+    return "name", name
+
+
+def _resolve_font_size(size):
+    return "size", _pt(size)
+
+
+def _resolve_font_bold(bold):
+    return "bold", bool(bold)
+
+
+def _resolve_font_italic(italic):
+    return "italic", bool(italic)
+
+
+def _resolve_font_underline(underline_type):
+    if isinstance(underline_type, bool):
+        return "underline", underline_type
+    if isinstance(underline_type, str):
+        underline = _UNDERLINE_TYPES.get(underline_type.upper())
+        if underline is not None:
+            return "underline", underline
+    return None
+
+
+def _resolve_font_color(color_spec):
+    # Enhanced color support
+    if isinstance(color_spec, dict):
+        # Advanced color with theme support
+        if "theme" in color_spec:
+            theme_color = _THEME_COLORS.get(color_spec["theme"].upper())
+            return ("theme_color", theme_color) if theme_color is not None else None
+        if "rgb" not in color_spec and "hex" not in color_spec:
+            return None
+    # Simple color string or rgb/hex dict
+    color = ColorFormatter.parse_color(color_spec)
+    return ("rgb", color) if color else None
+
+
+def _resolve_font_superscript(superscript):
+    return ("superscript", True) if superscript else None
+
+
+def _resolve_font_subscript(subscript):
+    return ("subscript", True) if subscript else None
+
+
+# Font config key -> resolver(value) returning a (font attribute, value) pair or None;
+# python-pptx has no strikethrough, so it has no entry
+_FONT_RESOLVERS = {
+    "name": _resolve_font_name,
+    "size": _resolve_font_size,
+    "bold": _resolve_font_bold,
+    "italic": _resolve_font_italic,
+    "underline": _resolve_font_underline,
+    "color": _resolve_font_color,
+    "superscript": _resolve_font_superscript,
+    "subscript": _resolve_font_subscript
+}
+
+# Resolved attributes that live on font.color rather than on the font itself
+_FONT_COLOR_ATTRIBUTES = frozenset({"rgb", "theme_color"})
+
+
+def _set_paragraph_alignment(paragraph, alignment) -> None:
+    alignment = _PARAGRAPH_ALIGNMENTS.get(alignment.lower())
+    if alignment is not None:
+        paragraph.alignment = alignment
+
+
+def _set_paragraph_space_before(paragraph, space_before) -> None:
+    paragraph.space_before = _pt(space_before)
+
+
+def _set_paragraph_space_after(paragraph, space_after) -> None:
+    paragraph.space_after = _pt(space_after)
+
+
+def _set_paragraph_line_spacing(paragraph, line_spacing) -> None:
+    if isinstance(line_spacing, (int, float)):
+        paragraph.line_spacing = line_spacing
+    elif isinstance(line_spacing, dict):
+        # Advanced line spacing with units
+        spacing_value = line_spacing.get("value", 1.0)
+        spacing_unit = line_spacing.get("unit", "multiple")  # "multiple", "points", "lines"
+        if spacing_unit == "multiple":
+            paragraph.line_spacing = spacing_value
+        elif spacing_unit == "points":
+            paragraph.line_spacing = _pt(spacing_value)
+
+
+def _set_paragraph_left_indent(paragraph, left_indent) -> None:
+    paragraph.left_indent = _inches(left_indent)
+
+
+def _set_paragraph_right_indent(paragraph, right_indent) -> None:
+    paragraph.right_indent = _inches(right_indent)
+
+
+def _set_paragraph_first_line_indent(paragraph, first_line_indent) -> None:
+    paragraph.first_line_indent = _inches(first_line_indent)
+
+
+def _set_paragraph_level(paragraph, level) -> None:
+    # Bullet/numbering level
+    paragraph.level = level
+
+
+# Paragraph config key -> setter(paragraph, value)
+_PARAGRAPH_SETTERS = {
+    "alignment": _set_paragraph_alignment,
+    "space_before": _set_paragraph_space_before,
+    "space_after": _set_paragraph_space_after,
+    "line_spacing": _set_paragraph_line_spacing,
+    "left_indent": _set_paragraph_left_indent,
+    "right_indent": _set_paragraph_right_indent,
+    "first_line_indent": _set_paragraph_first_line_indent,
+    "level": _set_paragraph_level
+}
 
 
 class LineFormatter:
@@ -223,12 +342,12 @@ class LineFormatter:
                 line.color.rgb = color
         
         if "width" in line_config:
-            line.width = Pt(line_config["width"])
+            line.width = _pt(line_config["width"])
         
         if "dash_style" in line_config:
-            dash_style = line_config["dash_style"].upper()
-            if hasattr(MSO_LINE_DASH_STYLE, dash_style):
-                line.dash_style = getattr(MSO_LINE_DASH_STYLE, dash_style)
+            dash_style = _DASH_STYLES.get(line_config["dash_style"].upper())
+            if dash_style is not None:
+                line.dash_style = dash_style
 
 
 class ShadowFormatter:
@@ -237,7 +356,8 @@ class ShadowFormatter:
     @staticmethod
     def apply_shadow(shape, shadow_config: Dict[str, Any]) -> None:
         """Apply shadow formatting to a shape."""
-        if not shadow_config:
+        # Only visibility and color are acted on; any other keys alone leave the inherited shadow (and XML) untouched
+        if not shadow_config or ("visible" not in shadow_config and "color" not in shadow_config):
             return
         
         shadow = shape.shadow
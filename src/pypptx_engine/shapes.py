@@ -4,17 +4,44 @@ Shape creation and management for all supported python-pptx shape types
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from pptx.util import Inches, Pt
 from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE, MSO_CONNECTOR_TYPE
-from pptx.enum.text import MSO_VERTICAL_ANCHOR
+from pptx.enum.text import MSO_VERTICAL_ANCHOR, PP_ALIGN
 from pptx.chart.data import CategoryChartData, XyChartData, BubbleChartData
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_DATA_LABEL_POSITION
 
 from .formatters import FontFormatter, ColorFormatter, LineFormatter, ShadowFormatter
 from .flowchart import FlowchartHandler
 
+# Chart types whose data is built from (x, y) / (x, y, size) points rather than categories
+_XY_CHART_TYPES = frozenset({
+    "XY_SCATTER", "XY_SCATTER_LINES", "XY_SCATTER_LINES_NO_MARKERS", "XY_SCATTER_SMOOTH", "XY_SCATTER_SMOOTH_NO_MARKERS"
+})
+_BUBBLE_CHART_TYPES = frozenset({"BUBBLE", "BUBBLE_THREE_D_EFFECT"})
+
+# Positions, margins and border widths repeat across a deck; the immutable lengths are built once and shared
+_inches = lru_cache(maxsize=512)(Inches)
+_pt = lru_cache(maxsize=512)(Pt)
+
+# Enum member name -> member, looked up with a single .get() instead of hasattr/getattr pairs
+_AUTO_SHAPE_TYPES = MSO_SHAPE.__members__
+_CONNECTOR_TYPES = MSO_CONNECTOR_TYPE.__members__
+_CHART_TYPES = XL_CHART_TYPE.__members__
+_LEGEND_POSITIONS = XL_LEGEND_POSITION.__members__
+_DATA_LABEL_POSITIONS = XL_DATA_LABEL_POSITION.__members__
+_CELL_ALIGNMENTS = PP_ALIGN.__members__
+_VERTICAL_ANCHORS = MSO_VERTICAL_ANCHOR.__members__
+
+# Text frame "vertical_anchor" values (lower-cased) -> python-pptx anchor
+_TEXT_FRAME_ANCHORS = {
+    "top": MSO_VERTICAL_ANCHOR.TOP,
+    "middle": MSO_VERTICAL_ANCHOR.MIDDLE,
+    "bottom": MSO_VERTICAL_ANCHOR.BOTTOM
+}
+
 
 class ShapeFactory:
     """Factory for creating various types of shapes."""
@@ -27,37 +54,73 @@ class ShapeFactory:
         self.table_handler = TableShapeHandler(color_formatter)
         self.autoshape_handler = AutoShapeHandler(color_formatter)
         self.flowchart_handler = FlowchartHandler(color_formatter)
+        # Shape "type" -> builder(slide, config, x, y, w, h); images also need base_dir and are handled separately
+        self._shape_builders = {
+            "text": self.text_handler.create_text_shape,
+            "bullet": self.text_handler.create_bullet_shape,
+            "chart": self.chart_handler.create_chart_shape,
+            "table": self.table_handler.create_table_shape,
+            "autoshape": self.autoshape_handler.create_autoshape,
+            "connector": self.autoshape_handler.create_connector,
+            "group": self.autoshape_handler.create_group_shape,
+            "freeform": self.autoshape_handler.create_freeform_shape,
+            "flowchart": self.flowchart_handler.create_flowchart
+        }
     
     def create_shape(self, slide, shape_config: Dict[str, Any], base_dir: str) -> None:
         """Create a shape based on configuration."""
         shape_type = shape_config.get("type", "").lower()
+        builder = self._shape_builders.get(shape_type)
+        if builder is None and shape_type != "image":
+            return
         
         # Get position and size
-        x = Inches(shape_config.get("x", 0))
-        y = Inches(shape_config.get("y", 0))
-        w = Inches(shape_config.get("w", 4))
-        h = Inches(shape_config.get("h", 1))
-        
-        if shape_type == "text":
-            self.text_handler.create_text_shape(slide, shape_config, x, y, w, h)
-        elif shape_type == "bullet":
-            self.text_handler.create_bullet_shape(slide, shape_config, x, y, w, h)
-        elif shape_type == "image":
+        x = _inches(shape_config.get("x", 0))
+        y = _inches(shape_config.get("y", 0))
+        w = _inches(shape_config.get("w", 4))
+        h = _inches(shape_config.get("h", 1))
+        
+        if builder is not None:
+            builder(slide, shape_config, x, y, w, h)
+        else:
             self.image_handler.create_image_shape(slide, shape_config, x, y, w, h, base_dir)
-        elif shape_type == "chart":
-            self.chart_handler.create_chart_shape(slide, shape_config, x, y, w, h)
-        elif shape_type == "table":
-            self.table_handler.create_table_shape(slide, shape_config, x, y, w, h)
-        elif shape_type == "autoshape":
-            self.autoshape_handler.create_autoshape(slide, shape_config, x, y, w, h)
-        elif shape_type == "connector":
-            self.autoshape_handler.create_connector(slide, shape_config, x, y, w, h)
-        elif shape_type == "group":
-            self.autoshape_handler.create_group_shape(slide, shape_config, x, y, w, h)
-        elif shape_type == "freeform":
-            self.autoshape_handler.create_freeform_shape(slide, shape_config, x, y, w, h)
-        elif shape_type == "flowchart":
-            self.flowchart_handler.create_flowchart(slide, shape_config, x, y, w, h)
+
+
+def _set_margin_left(text_frame, margin) -> None:
+    text_frame.margin_left = _inches(margin)
+
+
+def _set_margin_right(text_frame, margin) -> None:
+    text_frame.margin_right = _inches(margin)
+
+
+def _set_margin_top(text_frame, margin) -> None:
+    text_frame.margin_top = _inches(margin)
+
+
+def _set_margin_bottom(text_frame, margin) -> None:
+    text_frame.margin_bottom = _inches(margin)
+
+
+def _set_word_wrap(text_frame, word_wrap) -> None:
+    text_frame.word_wrap = bool(word_wrap)
+
+
+def _set_vertical_anchor(text_frame, vertical_anchor) -> None:
+    vertical_anchor = _TEXT_FRAME_ANCHORS.get(vertical_anchor.lower())
+    if vertical_anchor is not None:
+        text_frame.vertical_anchor = vertical_anchor
+
+
+# Text frame config key -> setter(text_frame, value)
+_TEXT_FRAME_SETTERS = {
+    "margin_left": _set_margin_left,
+    "margin_right": _set_margin_right,
+    "margin_top": _set_margin_top,
+    "margin_bottom": _set_margin_bottom,
+    "word_wrap": _set_word_wrap,
+    "vertical_anchor": _set_vertical_anchor
+}
 
 
 class TextShapeHandler:
@@ -75,7 +138,7 @@ class TextShapeHandler:
         text_frame.clear()
         
         # Set text frame properties
-        self._apply_text_frame_formatting(text_frame, config.get("text_frame", {}))
+        self._apply_text_frame_formatting(text_frame, config.get("text_frame"))
         
         # Add text content with enhanced support
         text_content = config.get("text", "")
@@ -100,14 +163,17 @@ class TextShapeHandler:
         run.text = text_content
         
         # Apply formatting
-        FontFormatter.apply_font_formatting(run.font, config.get("font", {}))
-        FontFormatter.apply_paragraph_formatting(p, config.get("paragraph", {}))
+        FontFormatter.apply_font_formatting(run.font, config.get("font"))
+        FontFormatter.apply_paragraph_formatting(p, config.get("paragraph"))
         
         # Apply hyperlinks and click actions
-        self._apply_text_actions(run, config.get("actions", {}))
+        self._apply_text_actions(run, config.get("actions"))
     
     def _create_multi_paragraph_text(self, text_frame, text_content: List, config: Dict[str, Any]) -> None:
         """Create multiple paragraphs with individual or shared formatting."""
+        # The shared font is resolved once rather than per paragraph
+        shared_font = FontFormatter.resolve_font(config.get("font"))
+        
         for i, para_item in enumerate(text_content):
             p = text_frame.add_paragraph() if i > 0 else text_frame.paragraphs[0]
             
@@ -117,8 +183,8 @@ class TextShapeHandler:
                 run.text = para_item
                 
                 # Apply shared formatting
-                FontFormatter.apply_font_formatting(run.font, config.get("font", {}))
-                FontFormatter.apply_paragraph_formatting(p, config.get("paragraph", {}))
+                FontFormatter.apply_resolved_font(run.font, shared_font)
+                FontFormatter.apply_paragraph_formatting(p, config.get("paragraph"))
                 
             elif isinstance(para_item, dict):
                 # Paragraph with individual formatting
@@ -127,21 +193,23 @@ class TextShapeHandler:
                 run.text = para_text
                 
                 # Apply paragraph-specific formatting first, then fallback to shared
-                para_font_config = para_item.get("font", config.get("font", {}))
-                para_paragraph_config = para_item.get("paragraph", config.get("paragraph", {}))
+                para_font = FontFormatter.resolve_font(para_item["font"]) if "font" in para_item else shared_font
+                para_paragraph_config = para_item.get("paragraph", config.get("paragraph"))
                 
-                FontFormatter.apply_font_formatting(run.font, para_font_config)
+                FontFormatter.apply_resolved_font(run.font, para_font)
                 FontFormatter.apply_paragraph_formatting(p, para_paragraph_config)
                 
                 # Apply paragraph-specific actions
-                self._apply_text_actions(run, para_item.get("actions", {}))
+                self._apply_text_actions(run, para_item.get("actions"))
     
     def _create_rich_text_content(self, text_frame, text_content: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Create rich text with advanced formatting options."""
         paragraphs_data = text_content.get("paragraphs", [])
+        shared_font = FontFormatter.resolve_font(config.get("font"))
         
         for i, para_data in enumerate(paragraphs_data):
             p = text_frame.add_paragraph() if i > 0 else text_frame.paragraphs[0]
+            para_font = FontFormatter.resolve_font(para_data["font"]) if "font" in para_data else shared_font
             
             # Handle runs within paragraph
             runs_data = para_data.get("runs", [])
@@ -154,17 +222,17 @@ class TextShapeHandler:
                 run.text = run_data.get("text", "")
                 
                 # Apply run-specific formatting
-                run_font_config = run_data.get("font", para_data.get("font", config.get("font", {})))
-                FontFormatter.apply_font_formatting(run.font, run_font_config)
+                run_font = FontFormatter.resolve_font(run_data["font"]) if "font" in run_data else para_font
+                FontFormatter.apply_resolved_font(run.font, run_font)
                 
                 # Apply run-specific actions
-                self._apply_text_actions(run, run_data.get("actions", {}))
+                self._apply_text_actions(run, run_data.get("actions"))
             
             # Apply paragraph-level formatting
-            para_paragraph_config = para_data.get("paragraph", config.get("paragraph", {}))
+            para_paragraph_config = para_data.get("paragraph", config.get("paragraph"))
             FontFormatter.apply_paragraph_formatting(p, para_paragraph_config)
     
-    def _apply_text_actions(self, run, actions_config: Dict[str, Any]) -> None:
+    def _apply_text_actions(self, run, actions_config: Optional[Dict[str, Any]]) -> None:
         """Apply hyperlinks and click actions to text runs."""
         if not actions_config:
             return
@@ -191,49 +259,32 @@ class TextShapeHandler:
         text_frame.clear()
         
         # Set text frame properties
-        self._apply_text_frame_formatting(text_frame, config.get("text_frame", {}))
+        self._apply_text_frame_formatting(text_frame, config.get("text_frame"))
         
         items = config.get("items", [])
+        font = FontFormatter.resolve_font(config.get("font"))
         for i, item in enumerate(items):
             p = text_frame.add_paragraph() if i > 0 else text_frame.paragraphs[0]
             p.text = str(item)
             p.level = config.get("level", 0)  # Bullet level
             
             # Apply formatting
-            FontFormatter.apply_font_formatting(p.font, config.get("font", {}))
-            FontFormatter.apply_paragraph_formatting(p, config.get("paragraph", {}))
+            FontFormatter.apply_resolved_font(p.font, font)
+            FontFormatter.apply_paragraph_formatting(p, config.get("paragraph"))
         
         # Apply shape-level formatting
         self._apply_shape_formatting(textbox, config)
     
-    def _apply_text_frame_formatting(self, text_frame, config: Dict[str, Any]) -> None:
+    def _apply_text_frame_formatting(self, text_frame, config: Optional[Dict[str, Any]]) -> None:
         """Apply text frame specific formatting."""
         if not config:
             return
         
-        if "margin_left" in config:
-            text_frame.margin_left = Inches(config["margin_left"])
-        if "margin_right" in config:
-            text_frame.margin_right = Inches(config["margin_right"])
-        if "margin_top" in config:
-            text_frame.margin_top = Inches(config["margin_top"])
-        if "margin_bottom" in config:
-            text_frame.margin_bottom = Inches(config["margin_bottom"])
-        
-        if "word_wrap" in config:
-            text_frame.word_wrap = bool(config["word_wrap"])
-        
-        if "auto_size" in config:
-            # Handle auto-sizing options
-            pass
-        
-        vertical_anchor = config.get("vertical_anchor", "").lower()
-        if vertical_anchor == "top":
-            text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
-        elif vertical_anchor == "middle":
-            text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-        elif vertical_anchor == "bottom":
-            text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.BOTTOM
+        # One pass over the keys actually present; "auto_size" has no setter yet
+        for key, value in config.items():
+            setter = _TEXT_FRAME_SETTERS.get(key)
+            if setter is not None:
+                setter(text_frame, value)
     
     def _apply_shape_formatting(self, shape, config: Dict[str, Any]) -> None:
         """Apply general shape formatting with transparent text support."""
@@ -270,6 +321,14 @@ class TextShapeHandler:
 class ImageShapeHandler:
     """Handle image shapes."""
     
+    def __init__(self):
+        # Resolved local path -> whether it exists, so a logo reused on every slide is stat'ed once per render
+        self._path_exists: Dict[str, bool] = {}
+    
+    def clear_path_cache(self) -> None:
+        """Forget existence checks from a previous render."""
+        self._path_exists.clear()
+    
     def create_image_shape(self, slide, config: Dict[str, Any], x, y, w, h, base_dir: str) -> None:
         """Create an image shape."""
         image_path = config.get("path") or config.get("url")
@@ -299,15 +358,18 @@ class ImageShapeHandler:
                 if not os.path.isabs(image_path):
                     image_path = os.path.join(base_dir, image_path)
                 
-                if not os.path.exists(image_path):
+                exists = self._path_exists.get(image_path)
+                if exists is None:
+                    exists = self._path_exists[image_path] = os.path.exists(image_path)
+                if not exists:
                     print(f"[WARN] Image not found, skipping: {image_path}")
                     return
                 
                 final_image_path = image_path
             
-            # Determine dimensions
-            width = Inches(config["w"]) if "w" in config else None
-            height = Inches(config["h"]) if "h" in config else None
+            # Reuse the converted size; a missing w/h keeps the picture's native dimension
+            width = w if "w" in config else None
+            height = h if "h" in config else None
             
             # Add picture
             picture = slide.shapes.add_picture(final_image_path, x, y, width=width, height=height)
@@ -344,9 +406,8 @@ class ChartShapeHandler:
         """Create a chart shape with support for all chart types."""
         chart_type_name = config.get("chartType", "COLUMN_CLUSTERED")
         
-        try:
-            chart_type = getattr(XL_CHART_TYPE, chart_type_name)
-        except AttributeError:
+        chart_type = _CHART_TYPES.get(chart_type_name)
+        if chart_type is None:
             print(f"[WARN] Unsupported chart type: {chart_type_name}")
             return
         
@@ -360,11 +421,11 @@ class ChartShapeHandler:
         chart = chart_shape.chart
         
         # Apply chart formatting
-        self._apply_chart_formatting(chart, config.get("formatting", {}))
+        self._apply_chart_formatting(chart, config.get("formatting"))
     
     def _prepare_chart_data(self, config: Dict[str, Any], chart_type_name: str):
         """Prepare chart data based on chart type."""
-        if chart_type_name in ["XY_SCATTER", "XY_SCATTER_LINES", "XY_SCATTER_LINES_NO_MARKERS", "XY_SCATTER_SMOOTH", "XY_SCATTER_SMOOTH_NO_MARKERS"]:
+        if chart_type_name in _XY_CHART_TYPES:
             # XY/Scatter charts
             chart_data = XyChartData()
             for series_config in config.get("series", []):
@@ -376,7 +437,7 @@ class ChartShapeHandler:
                         series.add_data_point(point[0], point[1])
             return chart_data
         
-        elif chart_type_name in ["BUBBLE", "BUBBLE_THREE_D_EFFECT"]:
+        elif chart_type_name in _BUBBLE_CHART_TYPES:
             # Bubble charts
             chart_data = BubbleChartData()
             for series_config in config.get("series", []):
@@ -400,7 +461,7 @@ class ChartShapeHandler:
                 chart_data.add_series(name, values)
             return chart_data
     
-    def _apply_chart_formatting(self, chart, formatting: Dict[str, Any]) -> None:
+    def _apply_chart_formatting(self, chart, formatting: Optional[Dict[str, Any]]) -> None:
         """Apply chart-specific formatting."""
         if not formatting:
             return
@@ -416,9 +477,9 @@ class ChartShapeHandler:
             chart.has_legend = legend_config.get("visible", True)
             if chart.has_legend:
                 legend = chart.legend
-                position = legend_config.get("position", "right").upper()
-                if hasattr(XL_LEGEND_POSITION, position):
-                    legend.position = getattr(XL_LEGEND_POSITION, position)
+                position = _LEGEND_POSITIONS.get(legend_config.get("position", "right").upper())
+                if position is not None:
+                    legend.position = position
         
         # Data labels
         if "data_labels" in formatting:
@@ -428,9 +489,9 @@ class ChartShapeHandler:
                 if plot.has_data_labels:
                     data_labels = plot.data_labels
                     if "position" in data_labels_config:
-                        position = data_labels_config["position"].upper()
-                        if hasattr(XL_DATA_LABEL_POSITION, position):
-                            data_labels.position = getattr(XL_DATA_LABEL_POSITION, position)
+                        position = _DATA_LABEL_POSITIONS.get(data_labels_config["position"].upper())
+                        if position is not None:
+                            data_labels.position = position
         
         # Axes formatting
         if "axes" in formatting:
@@ -491,7 +552,7 @@ class TableShapeHandler:
         self._apply_row_heights(table, row_heights)
         
         # Apply table-level formatting
-        self._apply_table_formatting(table, config.get("formatting", {}))
+        self._apply_table_formatting(table, config.get("formatting"))
         
         # Apply cell-specific formatting
         cell_formatting = config.get("cell_formatting", {})
@@ -499,7 +560,7 @@ class TableShapeHandler:
         
         # Apply header row formatting
         if config.get("header_row", False):
-            self._apply_header_formatting(table, config.get("header_formatting", {}))
+            self._apply_header_formatting(table, config.get("header_formatting"))
     
     def _populate_table_data(self, table, data: List[List], rows: int, cols: int) -> None:
         """Populate table with data."""
@@ -546,13 +607,13 @@ class TableShapeHandler:
         """Apply column widths."""
         for col_idx, width in enumerate(col_widths):
             if col_idx < len(table.columns):
-                table.columns[col_idx].width = Inches(width)
+                table.columns[col_idx].width = _inches(width)
     
     def _apply_row_heights(self, table, row_heights: List[float]) -> None:
         """Apply row heights."""
         for row_idx, height in enumerate(row_heights):
             if row_idx < len(table.rows):
-                table.rows[row_idx].height = Inches(height)
+                table.rows[row_idx].height = _inches(height)
     
     def _apply_cell_formatting(self, cell, formatting: Dict[str, Any]) -> None:
         """Apply comprehensive formatting to a table cell."""
@@ -569,9 +630,10 @@ class TableShapeHandler:
         
         # Text formatting
         if "font" in formatting:
+            font = FontFormatter.resolve_font(formatting["font"])
             for paragraph in cell.text_frame.paragraphs:
                 for run in paragraph.runs:
-                    FontFormatter.apply_font_formatting(run.font, formatting["font"])
+                    FontFormatter.apply_resolved_font(run.font, font)
         
         # Text alignment
         if "alignment" in formatting:
@@ -591,7 +653,7 @@ class TableShapeHandler:
                     cell.border_top.color = self.color_formatter.parse_color(
                         border_config.get("color", "#000000")
                     )
-                    cell.border_top.width = Pt(border_config.get("width", 1))
+                    cell.border_top.width = _pt(border_config.get("width", 1))
             
             # Bottom border
             if "bottom" in borders:
@@ -600,7 +662,7 @@ class TableShapeHandler:
                     cell.border_bottom.color = self.color_formatter.parse_color(
                         border_config.get("color", "#000000")
                     )
-                    cell.border_bottom.width = Pt(border_config.get("width", 1))
+                    cell.border_bottom.width = _pt(border_config.get("width", 1))
             
             # Left border
             if "left" in borders:
@@ -609,7 +671,7 @@ class TableShapeHandler:
                     cell.border_left.color = self.color_formatter.parse_color(
                         border_config.get("color", "#000000")
                     )
-                    cell.border_left.width = Pt(border_config.get("width", 1))
+                    cell.border_left.width = _pt(border_config.get("width", 1))
             
             # Right border
             if "right" in borders:
@@ -618,7 +680,7 @@ class TableShapeHandler:
                     cell.border_right.color = self.color_formatter.parse_color(
                         border_config.get("color", "#000000")
                     )
-                    cell.border_right.width = Pt(border_config.get("width", 1))
+                    cell.border_right.width = _pt(border_config.get("width", 1))
                     
         except Exception as e:
             print(f"[WARN] Failed to apply cell borders: {e}")
@@ -626,18 +688,16 @@ class TableShapeHandler:
     def _apply_text_alignment(self, cell, alignment: Dict[str, Any]) -> None:
         """Apply text alignment to cell."""
         try:
-            from pptx.enum.text import PP_ALIGN, MSO_VERTICAL_ANCHOR
-            
-            for paragraph in cell.text_frame.paragraphs:
-                # Horizontal alignment
-                h_align = alignment.get("horizontal", "left").upper()
-                if hasattr(PP_ALIGN, h_align):
-                    paragraph.alignment = getattr(PP_ALIGN, h_align)
+            # Horizontal alignment
+            h_align = _CELL_ALIGNMENTS.get(alignment.get("horizontal", "left").upper())
+            if h_align is not None:
+                for paragraph in cell.text_frame.paragraphs:
+                    paragraph.alignment = h_align
             
             # Vertical alignment
-            v_align = alignment.get("vertical", "middle").upper()
-            if hasattr(MSO_VERTICAL_ANCHOR, v_align):
-                cell.vertical_anchor = getattr(MSO_VERTICAL_ANCHOR, v_align)
+            v_align = _VERTICAL_ANCHORS.get(alignment.get("vertical", "middle").upper())
+            if v_align is not None:
+                cell.vertical_anchor = v_align
                 
         except Exception as e:
             print(f"[WARN] Failed to apply text alignment: {e}")
@@ -646,13 +706,13 @@ class TableShapeHandler:
         """Apply margins to cell."""
         try:
             if "left" in margins:
-                cell.margin_left = Inches(margins["left"])
+                cell.margin_left = _inches(margins["left"])
             if "right" in margins:
-                cell.margin_right = Inches(margins["right"])
+                cell.margin_right = _inches(margins["right"])
             if "top" in margins:
-                cell.margin_top = Inches(margins["top"])
+                cell.margin_top = _inches(margins["top"])
             if "bottom" in margins:
-                cell.margin_bottom = Inches(margins["bottom"])
+                cell.margin_bottom = _inches(margins["bottom"])
         except Exception as e:
             print(f"[WARN] Failed to apply cell margins: {e}")
     
@@ -675,7 +735,7 @@ class TableShapeHandler:
             except Exception as e:
                 print(f"[WARN] Failed to apply formatting to cell {cell_key}: {e}")
     
-    def _apply_header_formatting(self, table, header_formatting: Dict[str, Any]) -> None:
+    def _apply_header_formatting(self, table, header_formatting: Optional[Dict[str, Any]]) -> None:
         """Apply special formatting to header row."""
         if not header_formatting or len(table.rows) == 0:
             return
@@ -692,7 +752,7 @@ class TableShapeHandler:
             except Exception as e:
                 print(f"[WARN] Failed to apply header formatting to cell ({header_row_idx},{col_idx}): {e}")
     
-    def _apply_table_formatting(self, table, formatting: Dict[str, Any]) -> None:
+    def _apply_table_formatting(self, table, formatting: Optional[Dict[str, Any]]) -> None:
         """Apply table-level formatting."""
         if not formatting:
             return
@@ -753,9 +813,8 @@ class AutoShapeHandler:
         """Create an auto shape."""
         shape_type_name = config.get("shape_type", "RECTANGLE")
         
-        try:
-            shape_type = getattr(MSO_SHAPE, shape_type_name)
-        except AttributeError:
+        shape_type = _AUTO_SHAPE_TYPES.get(shape_type_name)
+        if shape_type is None:
             print(f"[WARN] Unsupported auto shape type: {shape_type_name}")
             return
         
@@ -769,9 +828,10 @@ class AutoShapeHandler:
             
             # Apply text formatting
             if "font" in config:
+                font = FontFormatter.resolve_font(config["font"])
                 for paragraph in autoshape.text_frame.paragraphs:
                     for run in paragraph.runs:
-                        FontFormatter.apply_font_formatting(run.font, config["font"])
+                        FontFormatter.apply_resolved_font(run.font, font)
         
         # Apply shape formatting
         if "fill" in config:
@@ -788,29 +848,27 @@ class AutoShapeHandler:
         connector_type_name = config.get("connector_type", "STRAIGHT")
         
         # Map connector type
-        connector_type = MSO_CONNECTOR_TYPE.STRAIGHT
-        if hasattr(MSO_CONNECTOR_TYPE, connector_type_name):
-            connector_type = getattr(MSO_CONNECTOR_TYPE, connector_type_name)
+        connector_type = _CONNECTOR_TYPES.get(connector_type_name, MSO_CONNECTOR_TYPE.STRAIGHT)
         
-        # Get connection points - x, y, w, h are already Inches() objects
+        # Get connection points - x, y, w, h are already _inches() objects
         # Use raw values from config or convert to Inches if specified
         if "begin_x" in config:
-            begin_x = Inches(config["begin_x"])
+            begin_x = _inches(config["begin_x"])
         else:
             begin_x = x
             
         if "begin_y" in config:
-            begin_y = Inches(config["begin_y"])
+            begin_y = _inches(config["begin_y"])
         else:
             begin_y = y
             
         if "end_x" in config:
-            end_x = Inches(config["end_x"])
+            end_x = _inches(config["end_x"])
         else:
             end_x = x + w
             
         if "end_y" in config:
-            end_y = Inches(config["end_y"])
+            end_y = _inches(config["end_y"])
         else:
             end_y = y + h
         
@@ -833,10 +891,10 @@ class AutoShapeHandler:
         # In a full implementation, you'd need to use lower-level APIs
         for shape_config in shapes_config:
             # Adjust positions relative to group
-            shape_x = x + Inches(shape_config.get("x", 0))
-            shape_y = y + Inches(shape_config.get("y", 0))
-            shape_w = Inches(shape_config.get("w", 1))
-            shape_h = Inches(shape_config.get("h", 1))
+            shape_x = x + _inches(shape_config.get("x", 0))
+            shape_y = y + _inches(shape_config.get("y", 0))
+            shape_w = _inches(shape_config.get("w", 1))
+            shape_h = _inches(shape_config.get("h", 1))
             
             # Create the shape (this would need the shape factory)
             # For now, just create basic shapes
@@ -851,8 +909,8 @@ class AutoShapeHandler:
         # Add points from configuration
         points = config.get("points", [])
         for i, point in enumerate(points):
-            point_x = x + Inches(point.get("x", 0))
-            point_y = y + Inches(point.get("y", 0))
+            point_x = x + _inches(point.get("x", 0))
+            point_y = y + _inches(point.get("y", 0))
             
             action = point.get("action", "line_to")
             if action == "move_to" or i == 0:
@@ -862,10 +920,10 @@ class AutoShapeHandler:
                 freeform_builder.add_line_segments([(point_x, point_y)])
             elif action == "curve_to":
                 # For curves, need control points
-                cp1_x = x + Inches(point.get("cp1_x", 0))
-                cp1_y = y + Inches(point.get("cp1_y", 0))
-                cp2_x = x + Inches(point.get("cp2_x", 0))
-                cp2_y = y + Inches(point.get("cp2_y", 0))
+                cp1_x = x + _inches(point.get("cp1_x", 0))
+                cp1_y = y + _inches(point.get("cp1_y", 0))
+                cp2_x = x + _inches(point.get("cp2_x", 0))
+                cp2_y = y + _inches(point.get("cp2_y", 0))
                 # Note: python-pptx has limited curve support
                 freeform_builder.add_line_segments([(point_x, point_y)])
         
@@ -121,9 +121,10 @@ class SlideManager:
         # Apply notes formatting if specified
         if "font" in notes_config:
             from .formatters import FontFormatter
+            font = FontFormatter.resolve_font(notes_config["font"])
             for paragraph in notes_text_frame.paragraphs:
                 for run in paragraph.runs:
-                    FontFormatter.apply_font_formatting(run.font, notes_config["font"])
+                    FontFormatter.apply_resolved_font(run.font, font)
     
     def _apply_picture_background(self, slide, image_path: str, config: Dict[str, Any]) -> None:
         """Apply picture background to slide."""
@@ -8,37 +8,55 @@ import json
 import sys
 import traceback
 from pathlib import Path
-from typing import Dict, Any, List
-
-from .engine import PPTXEngine
-from .formatters import ColorFormatter
+from typing import Dict, Any, List, Optional, Tuple
 
 
 class JSONValidator:
     """Validates JSON configuration files for pypptx-engine."""
     
     def __init__(self):
-        self.engine = PPTXEngine()
+        self._engine = None
         self.errors = []
         self.warnings = []
     
+    @property
+    def engine(self):
+        """Engine used for the compatibility test, created on first use."""
+        if self._engine is None:
+            from .engine import PPTXEngine
+            
+            self._engine = PPTXEngine()
+        return self._engine
+    
+    @engine.setter
+    def engine(self, engine):
+        self._engine = engine
+    
     def validate_json_syntax(self, file_path: str) -> bool:
         """Validate JSON syntax."""
+        ok, _ = self._load_config(file_path)
+        return ok
+    
+    def _load_config(self, file_path: str) -> Tuple[bool, Any]:
+        """Parse the JSON file, recording any syntax or file error; returns (ok, parsed value)."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                json.load(f)
-            return True
+                return True, json.load(f)
         except json.JSONDecodeError as e:
             self.errors.append(f"JSON Syntax Error: {e}")
-            return False
         except Exception as e:
             self.errors.append(f"File Error: {e}")
-            return False
+        return False, None
     
     def validate_structure(self, config: Dict[str, Any]) -> bool:
         """Validate the overall structure of the configuration."""
         valid = True
         
+        # Valid JSON such as null or a list has no keys to look up
+        if not isinstance(config, dict):
+            self.errors.append("Top-level JSON value must be an object")
+            return False
+        
         # Check for presentation wrapper
         if "presentation" not in config:
             self.errors.append("Missing 'presentation' root object")
@@ -194,11 +212,12 @@ class JSONValidator:
         
         return errors
     
-    def test_engine_compatibility(self, file_path: str) -> bool:
+    def test_engine_compatibility(self, file_path: str, config: Optional[Dict[str, Any]] = None) -> bool:
         """Test if the JSON can be processed by the engine."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            if config is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
             
             # Try to create presentation
             prs = self.engine.create_presentation(config, str(Path(file_path).parent))
@@ -225,19 +244,13 @@ class JSONValidator:
         print(f"Validating: {file_path}")
         print("=" * 50)
         
-        # Step 1: JSON syntax
-        if not self.validate_json_syntax(file_path):
+        # Step 1: JSON syntax; the parsed config is reused by every later step
+        ok, config = self._load_config(file_path)
+        if not ok:
             return False
         print("✅ JSON syntax valid")
         
-        # Step 2: Load and validate structure
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        except Exception as e:
-            self.errors.append(f"Failed to load JSON: {e}")
-            return False
-        
+        # Step 2: Validate structure
         if not self.validate_structure(config):
             return False
         print("✅ Structure valid")
@@ -251,7 +264,7 @@ class JSONValidator:
         
         # Step 4: Test engine compatibility
         if test_engine:
-            if not self.test_engine_compatibility(file_path):
+            if not self.test_engine_compatibility(file_path, config):
                 return False
             print("✅ Engine compatibility confirmed")
         
@@ -259,19 +272,20 @@ class JSONValidator:
     
     def print_results(self):
         """Print validation results."""
+        # Collect everything and write it out once rather than printing item by item
+        lines = []
         if self.warnings:
-            print("\n⚠️  Warnings:")
-            for warning in self.warnings:
-                print(f"  - {warning}")
+            lines.append("\n⚠️  Warnings:")
+            lines.extend(f"  - {warning}" for warning in self.warnings)
         
         if self.errors:
-            print("\n❌ Errors:")
-            for error in self.errors:
-                print(f"  - {error}")
-            return False
+            lines.append("\n❌ Errors:")
+            lines.extend(f"  - {error}" for error in self.errors)
         else:
-            print("\n✅ All validations passed!")
-            return True
+            lines.append("\n✅ All validations passed!")
+        
+        print("\n".join(lines))
+        return not self.errors
 
 
 def main():
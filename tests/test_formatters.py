@@ -0,0 +1,30 @@
+"""
+Tests for color parsing in the formatters module
+"""
+import pytest
+from pptx.dml.color import RGBColor
+
+from pypptx_engine.formatters import ColorFormatter
+
+
+def test_parse_color_accepts_any_hex_case():
+    assert ColorFormatter.parse_color("#ff0000") == RGBColor(0xFF, 0x00, 0x00)
+    assert ColorFormatter.parse_color("#FF0000") == RGBColor(0xFF, 0x00, 0x00)
+    assert ColorFormatter.parse_color("#Ff0000") == RGBColor(0xFF, 0x00, 0x00)
+    assert ColorFormatter.parse_color("#aBcDeF") == RGBColor(0xAB, 0xCD, 0xEF)
+    assert ColorFormatter.parse_color("FfFfFf") == RGBColor(0xFF, 0xFF, 0xFF)
+    assert ColorFormatter.parse_color({"hex": "#fF8000"}) == RGBColor(0xFF, 0x80, 0x00)
+
+
+def test_parse_color_rejects_malformed_hex():
+    assert ColorFormatter.parse_color("#zz0000") == RGBColor(0, 0, 0)
+    assert ColorFormatter.parse_color("#fff") == RGBColor(0, 0, 0)
+
+
+def test_parse_color_rgb_validation_does_not_depend_on_cache():
+    # typed caching: a float spec must not be served the int spec's cached result
+    with pytest.raises(ValueError):
+        ColorFormatter.parse_color({"rgb": [254.0, 0, 0]})
+    assert ColorFormatter.parse_color({"rgb": [254, 0, 0]}) == RGBColor(254, 0, 0)
+    with pytest.raises(ValueError):
+        ColorFormatter.parse_color({"rgb": [254.0, 0, 0]})